@@ -5,25 +5,78 @@ Handles loading and caching all game sprites.
 
 import pygame
 import os
+import threading
 from config import (
     BRICK_WIDTH, BRICK_HEIGHT, BALL_SIZE, PADDLE_WIDTH, PADDLE_HEIGHT,
-    PARTICLE_SIZE, HEART_SIZE, POWERUP_SIZE
+    PARTICLE_SIZE, HEART_SIZE, POWERUP_SIZE, BULLET_WIDTH, BULLET_HEIGHT,
+    PARTICLE_ALPHA_LEVELS
 )
+from atlas import load_or_build_atlas
+from sprite_cache import SpriteCache
+from startup_profile import NULL_PROFILER
+
+
+def sprite_specs():
+    """
+    List every sprite the game uses.
+    Returns (key, filename, size) tuples; size is the scaled size in pixels.
+    """
+    brick_size = (BRICK_WIDTH, BRICK_HEIGHT)
+    paddle_size = (PADDLE_WIDTH, PADDLE_HEIGHT)
+    specs = []
+    
+    # Bricks (assets 1-20): odd numbers are complete, even are cracked
+    for i in range(10):
+        specs.append((f"brick_complete_{i}", f"{i * 2 + 1:02d}-Breakout-Tiles.png", brick_size))
+        specs.append((f"brick_cracked_{i}", f"{i * 2 + 2:02d}-Breakout-Tiles.png", brick_size))
+    
+    # Particles (assets 21-30)
+    for i in range(10):
+        specs.append((f"particle_{i}", f"{i + 21:02d}-Breakout-Tiles.png", (PARTICLE_SIZE, PARTICLE_SIZE)))
+    
+    # Paddles
+    specs.append(("paddle_default", "31-Breakout-Tiles.png", paddle_size))       # +50
+    for i in range(6):
+        specs.append((f"paddle_100_anim_{i}", f"{i + 32:02d}-Breakout-Tiles.png", paddle_size))
+    specs.append(("paddle_100", "38-Breakout-Tiles.png", paddle_size))
+    specs.append(("paddle_250", "39-Breakout-Tiles.png", paddle_size))
+    specs.append(("paddle_500", "40-Breakout-Tiles.png", paddle_size))
+    specs.append(("paddle_slow", "41-Breakout-Tiles.png", paddle_size))
+    specs.append(("paddle_fast", "42-Breakout-Tiles.png", paddle_size))
+    specs.append(("paddle_bullet", "48-Breakout-Tiles.png", paddle_size))        # Super bullet
+    
+    # Other sprites
+    specs.append(("ball", "ball.png", (BALL_SIZE, BALL_SIZE)))
+    specs.append(("heart", "heart.png", (HEART_SIZE, HEART_SIZE)))
+    specs.append(("star", "star.png", (POWERUP_SIZE, POWERUP_SIZE)))
+    specs.append(("bullet", "vertical-bullet.png", (BULLET_WIDTH, BULLET_HEIGHT)))
+    return specs
 
 
 class AssetManager:
     """Centralized asset loading and management."""
     
-    def __init__(self):
+    def __init__(self, load_audio=True, particle_alpha_levels=PARTICLE_ALPHA_LEVELS,
+                 sprite_cache=True, background=False, profiler=NULL_PROFILER):
         self.sprites_dir = os.path.join(os.path.dirname(__file__), "Sprites")
+        self.profiler = profiler  # Times each asset (see startup_profile.py)
+        
+        # Disk cache of scaled sprites (None disables it)
+        self.sprite_cache = SpriteCache() if sprite_cache is True else sprite_cache or None
         
         # Brick sprites: 10 types, each with complete and cracked versions
         self.bricks_complete = []  # Indices 0-9 for brick types
         self.bricks_cracked = []   # Corresponding cracked versions
+        self.scaled_bricks = {}    # (type, cracked, size) -> sprite for shrunk brick grids
         
         # Particle sprites for each brick type
         self.particles = []
         
+        # Pre-faded particle frames: particle_fades[type][level], level 0 fully transparent
+        self.particle_fades = []
+        self.particle_fade_frames = []    # flat: index type * levels + level
+        self.particle_alpha_levels = particle_alpha_levels
+        
         # Paddle sprites
         self.paddle_default = None      # +50 (asset 31)
         self.paddle_100_anim = []       # Animation frames (assets 32-37)
@@ -43,18 +96,77 @@ class AssetManager:
         # Audio
         self.bg_music = None
         self.thud_sound = None
+        self.load_audio = load_audio
+        
+        # Loading progress; with background=True everything loads on a worker thread
+        self.loaded_count = 0
+        self.total_count = len(sprite_specs()) + (1 if load_audio else 0)
+        self.load_error = None
+        self._ready = threading.Event()
         
-        self._load_all_assets()
+        # Music is streamed by the mixer, so only its path is needed up front
+        if load_audio:
+            self.bg_music = self._audio_path("bg_music.mp3")
+        
+        if background:
+            self._loader = threading.Thread(
+                target=self._load_in_background, name="asset-loader", daemon=True
+            )
+            self._loader.start()
+        else:
+            self._load_all_assets()
+    
+    def _load_in_background(self):
+        """Worker thread entry point."""
+        try:
+            self._load_all_assets()
+        except Exception as e:
+            print(f"Error loading assets: {e}")
+            self.load_error = e
+            self._ready.set()
+    
+    def is_ready(self):
+        """Check if every asset has finished loading."""
+        return self._ready.is_set() and self.load_error is None
+    
+    def is_loading(self):
+        """Check if the loader thread is still running (it converts sprites for the display)."""
+        return not self._ready.is_set()
+    
+    def get_progress(self):
+        """Fraction of assets loaded so far (0-1)."""
+        return self.loaded_count / self.total_count if self.total_count else 1.0
+    
+    def wait_until_ready(self, timeout=None):
+        """
+        Block until all assets are loaded.
+        Returns False if timeout (seconds) expires first; re-raises loader errors.
+        """
+        if not self._ready.wait(timeout):
+            return False
+        if self.load_error is not None:
+            raise RuntimeError("Asset loading failed") from self.load_error
+        return True
     
     def _load_sprite(self, filename, scale_to=None):
-        """Load a single sprite and optionally scale it."""
+        """Load a single sprite and optionally scale it, using the disk cache when possible."""
         path = os.path.join(self.sprites_dir, filename)
         try:
+            cache_key = None
+            if scale_to and self.sprite_cache:
+                cache_key = self.sprite_cache.key_for(path, scale_to)
+                image = self.sprite_cache.load(cache_key, scale_to)
+                if image is not None:
+                    return image
+            
             image = pygame.image.load(path).convert_alpha()
             if scale_to:
                 image = pygame.transform.smoothscale(image, scale_to)
+            
+            if cache_key is not None:
+                self.sprite_cache.store(cache_key, image)
             return image
-        except pygame.error as e:
+        except (pygame.error, OSError) as e:
             print(f"Error loading {filename}: {e}")
             # Return a placeholder surface
             surface = pygame.Surface(scale_to or (32, 32))
@@ -63,80 +175,122 @@ class AssetManager:
     
     def _load_all_assets(self):
         """Load all game assets."""
-        # Load bricks (assets 1-20)
-        # Odd numbers are complete, even are cracked
-        for i in range(10):
-            complete_idx = i * 2 + 1
-            cracked_idx = i * 2 + 2
-            
-            complete_img = self._load_sprite(
-                f"{complete_idx:02d}-Breakout-Tiles.png",
-                (BRICK_WIDTH, BRICK_HEIGHT)
-            )
-            cracked_img = self._load_sprite(
-                f"{cracked_idx:02d}-Breakout-Tiles.png",
-                (BRICK_WIDTH, BRICK_HEIGHT)
-            )
-            
-            self.bricks_complete.append(complete_img)
-            self.bricks_cracked.append(cracked_img)
-        
-        # Load particles (assets 21-30)
-        for i in range(21, 31):
-            particle_img = self._load_sprite(
-                f"{i:02d}-Breakout-Tiles.png",
-                (PARTICLE_SIZE, PARTICLE_SIZE)
-            )
-            self.particles.append(particle_img)
+        profiler = self.profiler
         
-        # Load paddle sprites
-        paddle_size = (PADDLE_WIDTH, PADDLE_HEIGHT)
+        # Prefer the packed atlas (built on first launch); fall back to the individual files
+        with profiler.section("atlas"):
+            sprites = load_or_build_atlas(self.sprites_dir, sprite_cache=self.sprite_cache, profiler=profiler)
+        if sprites is None:
+            sprites = {}
+            for key, filename, size in sprite_specs():
+                with profiler.section(f"sprite {key}"):
+                    sprites[key] = self._load_sprite(filename, size)
+                self.loaded_count += 1
+        else:
+            self.loaded_count += len(sprites)
         
-        self.paddle_default = self._load_sprite("31-Breakout-Tiles.png", paddle_size)
+        # Bricks: complete and cracked versions per type
+        for i in range(10):
+            self.bricks_complete.append(sprites[f"brick_complete_{i}"])
+            self.bricks_cracked.append(sprites[f"brick_cracked_{i}"])
         
-        # +100 animation frames (32-37)
-        for i in range(32, 38):
-            frame = self._load_sprite(f"{i:02d}-Breakout-Tiles.png", paddle_size)
-            self.paddle_100_anim.append(frame)
+        # Particles
+        for i in range(10):
+            self.particles.append(sprites[f"particle_{i}"])
         
-        self.paddle_100 = self._load_sprite("38-Breakout-Tiles.png", paddle_size)
-        self.paddle_250 = self._load_sprite("39-Breakout-Tiles.png", paddle_size)
-        self.paddle_500 = self._load_sprite("40-Breakout-Tiles.png", paddle_size)
-        self.paddle_slow = self._load_sprite("41-Breakout-Tiles.png", paddle_size)
-        self.paddle_fast = self._load_sprite("42-Breakout-Tiles.png", paddle_size)
-        self.paddle_bullet = self._load_sprite("48-Breakout-Tiles.png", paddle_size)
+        with profiler.section("particle fades"):
+            self.build_particle_fades(self.particle_alpha_levels)
+        profiler.count("particle_fades.bytes", self.get_particle_fade_bytes())
         
-        # Load other sprites
-        self.ball = self._load_sprite("ball.png", (BALL_SIZE, BALL_SIZE))
-        self.heart = self._load_sprite("heart.png", (HEART_SIZE, HEART_SIZE))
-        self.star = self._load_sprite("star.png", (POWERUP_SIZE, POWERUP_SIZE))
-        self.bullet = self._load_sprite("vertical-bullet.png", (19, 41))
+        # Paddle sprites
+        self.paddle_default = sprites["paddle_default"]
+        self.paddle_100_anim = [sprites[f"paddle_100_anim_{i}"] for i in range(6)]
+        self.paddle_100 = sprites["paddle_100"]
+        self.paddle_250 = sprites["paddle_250"]
+        self.paddle_500 = sprites["paddle_500"]
+        self.paddle_slow = sprites["paddle_slow"]
+        self.paddle_fast = sprites["paddle_fast"]
+        self.paddle_bullet = sprites["paddle_bullet"]
+        
+        # Other sprites
+        self.ball = sprites["ball"]
+        self.heart = sprites["heart"]
+        self.star = sprites["star"]
+        self.bullet = sprites["bullet"]
         
         # Load audio
+        if self.load_audio:
+            with profiler.section("sound effects"):
+                self._load_audio()
+            self.loaded_count += 1
+        
+        self._ready.set()
+    
+    def _audio_path(self, filename):
+        """Get the path of a file in the Audios directory."""
         # We need to go up one level from sprites_dir to get to the project root, then into Audios
         # self.sprites_dir is .../Brick Breaker/Sprites
         project_dir = os.path.dirname(self.sprites_dir)
-        audios_dir = os.path.join(project_dir, "Audios")
-        
+        return os.path.join(project_dir, "Audios", filename)
+    
+    def _load_audio(self):
+        """Load sound effects."""
         try:
-            # Load background music
-            self.bg_music = os.path.join(audios_dir, "bg_music.mp3")
-            
-            # Load sound effects
-            self.thud_sound = pygame.mixer.Sound(os.path.join(audios_dir, "thud.mp3"))
+            self.thud_sound = pygame.mixer.Sound(self._audio_path("thud.mp3"))
         except pygame.error as e:
             print(f"Error loading audio: {e}")
     
-    def get_brick_sprite(self, brick_type, is_cracked=False):
-        """Get the appropriate brick sprite."""
-        if is_cracked:
-            return self.bricks_cracked[brick_type]
-        return self.bricks_complete[brick_type]
+    def get_brick_sprite(self, brick_type, is_cracked=False, size=None):
+        """Get the appropriate brick sprite, scaled to size if given (cached per size)."""
+        image = self.bricks_cracked[brick_type] if is_cracked else self.bricks_complete[brick_type]
+        if size is None:
+            return image
+        key = (brick_type, is_cracked, size)
+        scaled = self.scaled_bricks.get(key)
+        if scaled is None:
+            scaled = self.scaled_bricks[key] = pygame.transform.smoothscale(image, size)
+        return scaled
     
     def get_particle_sprite(self, brick_type):
         """Get the particle sprite for a brick type."""
         return self.particles[brick_type]
     
+    def build_particle_fades(self, levels):
+        """
+        Build the table of pre-faded particle frames.
+        Each particle type gets `levels` copies with alpha baked into the
+        pixels, evenly spaced from transparent to opaque.
+        """
+        levels = max(2, levels)
+        self.particle_alpha_levels = levels
+        self.particle_fades = []
+        
+        for image in self.particles:
+            frames = []
+            for level in range(levels):
+                alpha = round(255 * level / (levels - 1))
+                frame = image.copy()
+                frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                frames.append(frame)
+            self.particle_fades.append(frames)
+        self.particle_fade_frames = [frame for frames in self.particle_fades for frame in frames]
+    
+    def get_particle_fade_level(self, alpha):
+        """Quantize an alpha value (0-255) to a fade frame index."""
+        return (alpha * (self.particle_alpha_levels - 1) + 127) // 255
+    
+    def get_particle_fade(self, brick_type, alpha):
+        """Get the pre-faded particle frame closest to alpha (0-255)."""
+        return self.particle_fades[brick_type][self.get_particle_fade_level(alpha)]
+    
+    def get_particle_fade_bytes(self):
+        """Memory used by the pre-faded particle frames, in bytes."""
+        return sum(
+            frame.get_bytesize() * frame.get_width() * frame.get_height()
+            for frames in self.particle_fades
+            for frame in frames
+        )
+    
     def get_paddle_sprite(self, score_display=None, powerup=None):
         """Get the appropriate paddle sprite based on state."""
         if powerup == "slow":
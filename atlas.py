@@ -0,0 +1,249 @@
+"""
+Texture atlas for Breakout.
+Packs every pre-scaled sprite into one or a few sheets with a JSON
+manifest, so the game can load a couple of sheets at startup instead of
+decoding and scaling each sprite file. Decoded sheets are kept in the
+raw sprite cache, so warm starts decode no PNGs at all. The game builds
+the atlas itself when it is missing or any sprite file or size has
+changed. Sprite files are only re-hashed when their sizes or mtimes
+differ from the manifest.
+
+Usage:
+    python atlas.py          # (re)build Sprites/atlas/
+"""
+
+import hashlib
+import json
+import os
+import pygame
+from config import ATLAS_SHEET_SIZE, ATLAS_PADDING
+from sprite_cache import SpriteCache
+from startup_profile import NULL_PROFILER
+
+ATLAS_DIR = "atlas"
+MANIFEST_NAME = "atlas.json"
+MANIFEST_VERSION = 1
+
+
+def specs_signature(sprites_dir, specs):
+    """
+    Fingerprint the sprite specs and the contents of their source files
+    (with the sprite cache's keys), so checkouts and touches that leave
+    the pixels alone keep the atlas valid. Any change to a file, target
+    size or the list itself changes the result.
+    """
+    cache = SpriteCache()
+    digest = hashlib.sha1()
+    for key, filename, size in specs:
+        digest.update(f"{key}|{filename}|{cache.key_for(os.path.join(sprites_dir, filename), size)}\n".encode())
+    return digest.hexdigest()
+
+
+def stat_signature(sprites_dir, specs):
+    """
+    Cheap fingerprint of the sprite specs from file sizes and mtimes only.
+    If it matches the manifest, the atlas is current without reading any
+    sprite file; if not, specs_signature() decides.
+    """
+    digest = hashlib.sha1()
+    for key, filename, size in specs:
+        stat = os.stat(os.path.join(sprites_dir, filename))
+        digest.update(f"{key}|{filename}|{size[0]}x{size[1]}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _is_current(manifest, atlas_dir, sprites_dir, specs):
+    """
+    Check a manifest against the sprite files: by stat signature first,
+    then by content. When only the stat signature is stale (a checkout
+    or touch), the manifest is updated so the next launch is cheap again.
+    """
+    stats = stat_signature(sprites_dir, specs)
+    if manifest.get("stat_signature") == stats:
+        return True
+    if manifest.get("signature") != specs_signature(sprites_dir, specs):
+        return False
+    
+    manifest["stat_signature"] = stats
+    try:
+        with open(os.path.join(atlas_dir, MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+    except OSError:
+        pass  # Read-only install: keep re-hashing, the atlas is still valid
+    return True
+
+
+def pack(sizes, sheet_size=ATLAS_SHEET_SIZE, padding=ATLAS_PADDING):
+    """
+    Shelf-pack rects into square sheets.
+    sizes maps key -> (w, h). Returns key -> (sheet, x, y).
+    """
+    placements = {}
+    sheet, x, y, shelf_height = 0, 0, 0, 0
+    
+    # Tallest first keeps shelves tight
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if w > sheet_size or h > sheet_size:
+            raise ValueError(f"Sprite {key} ({w}x{h}) does not fit a {sheet_size}px sheet")
+        
+        if x + w > sheet_size:
+            # Start a new shelf
+            x, y = 0, y + shelf_height + padding
+            shelf_height = 0
+        if y + h > sheet_size:
+            # Start a new sheet
+            sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+        
+        placements[key] = (sheet, x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    
+    return placements
+
+
+def build_atlas(sprites_dir, specs):
+    """Scale every sprite, pack them into sheets and write the manifest."""
+    images = {}
+    for key, filename, size in specs:
+        image = pygame.image.load(os.path.join(sprites_dir, filename))
+        images[key] = pygame.transform.smoothscale(image, size)
+    
+    placements = pack({key: image.get_size() for key, image in images.items()})
+    num_sheets = max(sheet for sheet, _, _ in placements.values()) + 1
+    
+    out_dir = os.path.join(sprites_dir, ATLAS_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    
+    sheets = []
+    for index in range(num_sheets):
+        keys = [key for key, placement in placements.items() if placement[0] == index]
+        width = max(placements[key][1] + images[key].get_width() for key in keys)
+        height = max(placements[key][2] + images[key].get_height() for key in keys)
+        
+        sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+        for key in keys:
+            sheet.blit(images[key], placements[key][1:], special_flags=pygame.BLEND_RGBA_MAX)
+        
+        name = f"atlas_{index}.png"
+        pygame.image.save(sheet, os.path.join(out_dir, name))
+        sheets.append(name)
+    
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "signature": specs_signature(sprites_dir, specs),
+        "stat_signature": stat_signature(sprites_dir, specs),
+        "sheets": sheets,
+        "sprites": {
+            key: {"sheet": sheet, "rect": [x, y, *images[key].get_size()]}
+            for key, (sheet, x, y) in placements.items()
+        },
+    }
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    
+    return manifest
+
+
+def _sheet_size(manifest, index):
+    """Get a sheet's (width, height) from the rects of the sprites on it."""
+    rects = [entry["rect"] for entry in manifest["sprites"].values() if entry["sheet"] == index]
+    return max(x + w for x, _, w, _ in rects), max(y + h for _, y, _, h in rects)
+
+
+def _sheet_key(manifest, name, size):
+    """Sprite cache key of a sheet: changes whenever the atlas is rebuilt from different sprites."""
+    digest = hashlib.sha1(f"{manifest['signature']}|{name}".encode()).hexdigest()
+    return f"{digest}_{size[0]}x{size[1]}"
+
+
+def _load_sheet(atlas_dir, manifest, index, sprite_cache):
+    """
+    Load one sheet converted for the display, from the raw sprite cache
+    when possible so warm starts skip PNG decoding.
+    """
+    name = manifest["sheets"][index]
+    if sprite_cache is None:
+        return pygame.image.load(os.path.join(atlas_dir, name)).convert_alpha()
+    
+    size = _sheet_size(manifest, index)
+    key = _sheet_key(manifest, name, size)
+    sheet = sprite_cache.load(key, size)
+    if sheet is None:
+        sheet = pygame.image.load(os.path.join(atlas_dir, name)).convert_alpha()
+        sprite_cache.store(key, sheet)
+    return sheet
+
+
+def load_atlas(sprites_dir, specs=None, sprite_cache=None, profiler=NULL_PROFILER):
+    """
+    Load the atlas sheets and slice them into sprites.
+    Returns key -> Surface, or None if the atlas is missing or out of date.
+    Requires a display mode to be set (sheets are converted for fast blits).
+    With a SpriteCache, sheets are kept there as raw pixels after their
+    first load. The profiler times the manifest check, each sheet and
+    each sprite.
+    """
+    if specs is None:
+        from assets import sprite_specs
+        specs = sprite_specs()
+    
+    atlas_dir = os.path.join(sprites_dir, ATLAS_DIR)
+    try:
+        with profiler.section("atlas manifest"):
+            with open(os.path.join(atlas_dir, MANIFEST_NAME)) as f:
+                manifest = json.load(f)
+            if manifest.get("version") != MANIFEST_VERSION:
+                return None
+            if not _is_current(manifest, atlas_dir, sprites_dir, specs):
+                return None
+        
+        sheets = []
+        for index, name in enumerate(manifest["sheets"]):
+            with profiler.section(f"atlas sheet {name}"):
+                sheets.append(_load_sheet(atlas_dir, manifest, index, sprite_cache))
+        
+        entries = manifest["sprites"]
+        sprites = {}
+        for key, _, _ in specs:
+            with profiler.section(f"sprite {key}"):
+                sprites[key] = sheets[entries[key]["sheet"]].subsurface(pygame.Rect(entries[key]["rect"]))
+        return sprites
+    except (OSError, ValueError, KeyError, pygame.error):
+        return None
+
+
+def load_or_build_atlas(sprites_dir, specs=None, sprite_cache=None, profiler=NULL_PROFILER):
+    """
+    Load the atlas, first (re)building it if it is missing or out of date.
+    Returns key -> Surface, or None if the atlas cannot be built (for
+    example in a read-only install), in which case sprites must be
+    loaded one by one.
+    """
+    if specs is None:
+        from assets import sprite_specs
+        specs = sprite_specs()
+    
+    sprites = load_atlas(sprites_dir, specs, sprite_cache, profiler)
+    if sprites is None:
+        try:
+            with profiler.section("atlas build"):
+                build_atlas(sprites_dir, specs)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Error building sprite atlas: {e}")
+            return None
+        sprites = load_atlas(sprites_dir, specs, sprite_cache, profiler)
+    return sprites
+
+
+def main():
+    """Build the atlas from the current sprite specs."""
+    from assets import sprite_specs
+    
+    sprites_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Sprites")
+    manifest = build_atlas(sprites_dir, sprite_specs())
+    print(f"Packed {len(manifest['sprites'])} sprites into {len(manifest['sheets'])} sheet(s) "
+          f"in {os.path.join(sprites_dir, ATLAS_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Background generation for Breakout.
+Builds gradient backgrounds, optionally with film-grain noise and a
+vignette, as whole-array NumPy operations and caches the results per
+theme and resolution. Each level picks a theme from LEVEL_THEMES.
+"""
+
+import threading
+import zlib
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Theme name -> gradient end colors and effect strengths
+THEMES = {
+    "classic": {"top": (20, 20, 35), "bottom": (35, 35, 55), "noise": 0, "vignette": 0.0},
+    "deep_sea": {"top": (8, 18, 38), "bottom": (14, 48, 70), "noise": 3, "vignette": 0.35},
+    "dusk": {"top": (24, 14, 40), "bottom": (62, 28, 58), "noise": 3, "vignette": 0.3},
+    "ember": {"top": (30, 12, 12), "bottom": (70, 28, 16), "noise": 5, "vignette": 0.4},
+    "nebula": {"top": (12, 8, 30), "bottom": (40, 22, 70), "noise": 8, "vignette": 0.5},
+}
+
+DEFAULT_THEME = "classic"
+
+# Theme for each level; levels past the end cycle through the list
+LEVEL_THEMES = ["classic", "deep_sea", "dusk", "ember", "nebula"]
+
+
+def theme_for_level(level_index):
+    """Get the theme name for a 0-indexed level."""
+    return LEVEL_THEMES[level_index % len(LEVEL_THEMES)]
+
+
+def generate_background(theme, size):
+    """Render a theme at the given (width, height) into a new Surface."""
+    params = THEMES[theme]
+    width, height = size
+    surface = pygame.Surface(size)
+    
+    if np is None:
+        _draw_gradient_lines(surface, params)
+        return surface
+    
+    # One color per row, matching int(top + (bottom - top) * y / height)
+    top = np.array(params["top"], dtype=np.float64)
+    delta = np.array(params["bottom"], dtype=np.float64) - top
+    ratio = np.arange(height, dtype=np.float64) / height
+    rows = (top + delta * ratio[:, None]).astype(np.int32)
+    
+    if not params["noise"] and not params["vignette"]:
+        pixels = np.broadcast_to(rows[None, :, :], (width, height, 3))
+        pygame.surfarray.blit_array(surface, pixels)
+        return surface
+    
+    # Work on contiguous (channel, x, y) planes so per-pixel effects broadcast over long rows
+    planes = np.broadcast_to(rows.T[:, None, :], (3, width, height)).astype(np.float32, order="C")
+    
+    if params["vignette"]:
+        # Darken towards the corners: 1 at the centre, 1 - vignette at the corners
+        x = np.linspace(-1, 1, width, dtype=np.float32)
+        y = np.linspace(-1, 1, height, dtype=np.float32)
+        distance = (x[:, None] ** 2 + y[None, :] ** 2) / 2
+        planes *= 1 - params["vignette"] * distance
+    
+    if params["noise"]:
+        # Monochrome grain, seeded by the theme so it is the same every launch
+        rng = np.random.default_rng(zlib.crc32(theme.encode()))
+        planes += rng.standard_normal((width, height), dtype=np.float32) * params["noise"]
+    
+    np.clip(planes, 0, 255, out=planes)
+    pygame.surfarray.blit_array(surface, planes.astype(np.uint8).transpose(1, 2, 0))
+    return surface
+
+
+def _draw_gradient_lines(surface, params):
+    """Plain gradient without NumPy, one line per row (no noise or vignette)."""
+    width, height = surface.get_size()
+    top, bottom = params["top"], params["bottom"]
+    for y in range(height):
+        ratio = y / height
+        color = tuple(int(t + (b - t) * ratio) for t, b in zip(top, bottom))
+        pygame.draw.line(surface, color, (0, y), (width, y))
+
+
+class BackgroundCache:
+    """Generated backgrounds keyed by (theme, resolution).
+    
+    Each surface is built once; switching levels or toggling fullscreen
+    only regenerates when the theme or the screen size is new.
+    prefetch() builds themes on a worker thread ahead of use, so a level
+    change does not stall on generating its background; get() waits for
+    a theme the worker is still building rather than building it twice.
+    """
+    
+    def __init__(self):
+        self.surfaces = {}
+        self.pending = {}  # key -> Event set once the worker has finished it
+        self.lock = threading.Lock()
+    
+    def prefetch(self, themes, size):
+        """Start generating the given themes at a resolution in the background."""
+        with self.lock:
+            keys = [(theme, tuple(size)) for theme in dict.fromkeys(themes)]
+            keys = [key for key in keys if key not in self.surfaces and key not in self.pending]
+            for key in keys:
+                self.pending[key] = threading.Event()
+        if keys:
+            threading.Thread(
+                target=self._generate_pending, args=(keys,), name="background-generator", daemon=True
+            ).start()
+    
+    def _generate_pending(self, keys):
+        """Worker thread: generate each key, then wake anyone waiting for it."""
+        for key in keys:
+            try:
+                surface = generate_background(*key)
+            except Exception as e:
+                print(f"Error generating background {key[0]}: {e}")
+                surface = None  # get() generates it on the main thread instead
+            with self.lock:
+                if surface is not None:
+                    self.surfaces[key] = surface
+                event = self.pending.pop(key)
+            event.set()
+    
+    def get(self, theme, size):
+        """Get the background for a theme at a resolution, generating it on first use."""
+        key = (theme, tuple(size))
+        with self.lock:
+            surface = self.surfaces.get(key)
+            pending = self.pending.get(key)
+        if surface is None and pending is not None:
+            pending.wait()
+            surface = self.surfaces.get(key)
+        if surface is None:
+            surface = generate_background(theme, key[1])
+            with self.lock:
+                self.surfaces[key] = surface
+        return surface
+    
+    def clear(self):
+        """Drop all cached backgrounds (themes still being prefetched are kept)."""
+        with self.lock:
+            self.surfaces.clear()
@@ -0,0 +1,242 @@
+"""
+Batch simulator for level balancing.
+Plays many headless games with the tracking AI, one seed per game,
+spread across a process pool, and streams per-level statistics to a
+columnar file: Parquet when pyarrow is installed, CSV otherwise. The
+AI's reaction time, speed and aim are adjustable so it plays like a
+player who loses lives, not a perfect one.
+
+Usage:
+    python batch_sim.py --games 1000 --output stats.parquet
+    python batch_sim.py --games 200 --workers 4 --output stats.csv
+    python batch_sim.py --games 200 --reaction 6 --noise 0.25   # weaker player
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+from config import SIM_STEP, STATE_PLAYING, STATE_LEVEL_COMPLETE
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# One row per level played by one game
+COLUMNS = [
+    ("seed", int),
+    ("level", int),            # 1-indexed
+    ("outcome", str),          # cleared, game_over or timeout
+    ("ticks", int),
+    ("clear_time_s", float),   # Game time spent on the level
+    ("lives_lost", int),
+    ("score", int),            # Points scored on the level
+    ("powerups_spawned", int),
+    ("powerups_collected", int),
+]
+
+# Rows buffered per Parquet row group
+BATCH_ROWS = 4096
+
+_game = None  # Per-worker HeadlessGame, reused across seeds
+
+
+def _init_worker():
+    """Pool initializer: build one headless game per process."""
+    global _game
+    # Keep SIGTERM/SIGINT fatal, otherwise SDL turns them into QUIT events
+    # and pool shutdown waits on workers forever
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    from controls import TrackingInput
+    from headless import HeadlessGame
+    
+    _game = HeadlessGame(auto_advance=False)  # play() installs each game's input source
+
+
+def play(seed, max_ticks, spread=0.4, reaction=0, max_speed=None, noise=0.0):
+    """
+    Play one game to the end (or max_ticks) with the given seed and AI
+    skill (see TrackingInput). Returns a list of per-level rows.
+    """
+    from controls import TrackingInput
+    
+    game = _game
+    game.input_source = TrackingInput(seed=seed, spread=spread, reaction=reaction,
+                                      max_speed=max_speed, noise=noise)
+    game.new_game(seed=seed)
+    
+    rows = []
+    ticks_left = max_ticks
+    while True:
+        level = game.level_manager.get_current_level_num()
+        lives, score = game.lives, game.score
+        spawned, collected = game.powerup_manager.spawned, game.powerup_manager.collected
+        
+        ticks = game.run(ticks_left)
+        ticks_left -= ticks
+        
+        if game.state == STATE_LEVEL_COMPLETE:
+            outcome = "cleared"
+        elif game.state == STATE_PLAYING:
+            outcome = "timeout"
+        else:
+            outcome = "game_over"
+        
+        rows.append({
+            "seed": seed,
+            "level": level,
+            "outcome": outcome,
+            "ticks": ticks,
+            "clear_time_s": ticks * game.dt / 1000,
+            "lives_lost": lives - game.lives,
+            "score": game.score - score,
+            "powerups_spawned": game.powerup_manager.spawned - spawned,
+            "powerups_collected": game.powerup_manager.collected - collected,
+        })
+        
+        if outcome != "cleared" or ticks_left <= 0:
+            return rows
+        game.advance_level()
+        if game.state != STATE_PLAYING:
+            return rows  # Won the game
+
+
+def _play_task(args):
+    return play(*args)
+
+
+class CsvWriter:
+    """Streams rows to a CSV file."""
+    
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=[name for name, _ in COLUMNS])
+        self.writer.writeheader()
+    
+    def write(self, rows):
+        self.writer.writerows(rows)
+    
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """Streams rows to a Parquet file in row groups of BATCH_ROWS."""
+    
+    TYPES = {int: pa.int64(), float: pa.float64(), str: pa.string()} if pa else {}
+    
+    def __init__(self, path):
+        self.schema = pa.schema([(name, self.TYPES[kind]) for name, kind in COLUMNS])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.pending = []
+    
+    def write(self, rows):
+        self.pending.extend(rows)
+        if len(self.pending) >= BATCH_ROWS:
+            self._flush()
+    
+    def _flush(self):
+        if self.pending:
+            columns = {name: [row[name] for row in self.pending] for name, _ in COLUMNS}
+            self.writer.write_table(pa.table(columns, schema=self.schema))
+            self.pending = []
+    
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+def open_writer(path):
+    """Pick the output format from the extension; Parquet needs pyarrow."""
+    if path.endswith(".parquet"):
+        if pa is not None:
+            return ParquetWriter(path)
+        path = path[:-len(".parquet")] + ".csv"
+        print(f"pyarrow is not installed, writing CSV to {path}")
+    return CsvWriter(path)
+
+
+def summarize(rows):
+    """Aggregate per-level stats from the collected rows."""
+    levels = {}
+    for row in rows:
+        levels.setdefault(row["level"], []).append(row)
+    
+    summary = {}
+    for level, entries in sorted(levels.items()):
+        cleared = [row for row in entries if row["outcome"] == "cleared"]
+        scores = sorted(row["score"] for row in entries)
+        spawned = sum(row["powerups_spawned"] for row in entries)
+        summary[level] = {
+            "games": len(entries),
+            "clear_rate": len(cleared) / len(entries),
+            "mean_clear_time_s": sum(row["clear_time_s"] for row in cleared) / len(cleared) if cleared else None,
+            "mean_lives_lost": sum(row["lives_lost"] for row in entries) / len(entries),
+            "score_p10": scores[len(scores) // 10],
+            "score_p50": scores[len(scores) // 2],
+            "score_p90": scores[len(scores) * 9 // 10],
+            "pickup_rate": sum(row["powerups_collected"] for row in entries) / spawned if spawned else None,
+        }
+    return summary
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Simulate many Breakout games in parallel.")
+    parser.add_argument("--games", type=int, default=100, help="number of games (one seed each)")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--max-ticks", type=int, default=60 * 60 * 10,
+                        help="tick limit per game (default: 10 minutes of game time)")
+    parser.add_argument("--spread", type=float, default=0.4,
+                        help="AI aim offset as a fraction of paddle width")
+    parser.add_argument("--reaction", type=int, default=3,
+                        help="AI reaction delay in ticks (0 with no other skill limits never misses)")
+    parser.add_argument("--max-speed", type=float, default=8,
+                        help="AI paddle speed cap in pixels per tick (0 for no cap)")
+    parser.add_argument("--noise", type=float, default=0.15,
+                        help="AI aim error (standard deviation) as a fraction of paddle width")
+    parser.add_argument("--output", default="batch_stats.parquet",
+                        help="output file (.parquet or .csv)")
+    args = parser.parse_args()
+    
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # One banner per worker otherwise
+    
+    max_speed = args.max_speed or None
+    tasks = [(seed, args.max_ticks, args.spread, args.reaction, max_speed, args.noise)
+             for seed in range(args.seed, args.seed + args.games)]
+    writer = open_writer(args.output)
+    rows = []
+    
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+        # Games finish out of order; stream each one's rows as soon as it is done
+        chunksize = max(1, args.games // (args.workers * 8))
+        for game_rows in pool.imap_unordered(_play_task, tasks, chunksize=chunksize):
+            writer.write(game_rows)
+            rows.extend(game_rows)
+        pool.close()
+        pool.join()
+    writer.close()
+    elapsed = time.perf_counter() - start
+    
+    ticks = sum(row["ticks"] for row in rows)
+    print(f"{args.games} games, {ticks} ticks ({ticks * SIM_STEP / 3600000:.1f}h game time) "
+          f"in {elapsed:.1f}s on {args.workers} workers: {args.games / elapsed:.1f} games/s, "
+          f"{ticks / elapsed:.0f} ticks/s")
+    
+    print(f"{'level':>5} {'games':>6} {'cleared':>8} {'clear s':>8} {'lives':>6} "
+          f"{'score p10/p50/p90':>20} {'pickups':>8}")
+    for level, stats in summarize(rows).items():
+        clear_time = f"{stats['mean_clear_time_s']:.1f}" if stats["mean_clear_time_s"] is not None else "-"
+        pickups = f"{stats['pickup_rate']:.0%}" if stats["pickup_rate"] is not None else "-"
+        scores = f"{stats['score_p10']}/{stats['score_p50']}/{stats['score_p90']}"
+        print(f"{level:>5} {stats['games']:>6} {stats['clear_rate']:>8.0%} {clear_time:>8} "
+              f"{stats['mean_lives_lost']:>6.2f} {scores:>20} {pickups:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Frame benchmark suite for Breakout.
+Plays fixed, seeded stress scenarios headless with the SDL dummy video
+driver and times every frame's update and draw, so regressions in the
+game's hot paths show up before release.
+
+Scenarios:
+    level5      the densest built-in level, played by the tracking AI
+    wall        a synthetic 2000-brick wall
+    particles   10000 live particles, topped up every frame
+    bullets     the bullet power-up held on, firing every BULLET_COOLDOWN
+    powerups    several hundred power-ups falling at once
+
+Usage:
+    python bench_frames.py --frames 1200
+    python bench_frames.py --scenario wall --scenario particles --json frames.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+# Must be set before pygame is imported by the game modules
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from bench_startup import percentile
+from bricks import BrickField
+from config import (
+    SCREEN_WIDTH, BRICK_TOP_OFFSET, INITIAL_LIVES, POWERUP_BULLET, POWERUP_DURATION,
+    STATE_PLAYING, STATE_LEVEL_COMPLETE
+)
+from controls import TrackingInput
+from headless import HeadlessGame
+
+REPORT_VERSION = 1
+SEED = 1234
+PERCENTILES = (50, 99)
+
+WALL_COLS, WALL_ROWS = 50, 40     # 2000 bricks
+WALL_BRICK_SIZE = (18, 8)
+WALL_PADDING = 2
+PARTICLE_TARGET = 10000
+POWERUP_TARGET = 300
+
+
+def setup_level5(game, rng):
+    """Start on the last built-in level and replay it whenever it is cleared."""
+    game.new_game(seed=SEED, level=4)
+    
+    def replay_cleared_level():
+        if game.state == STATE_LEVEL_COMPLETE:
+            game.set_brick_field(game.level_manager.get_level_field())
+            game.state = STATE_PLAYING
+    return replay_cleared_level
+
+
+def setup_wall(game, rng):
+    """Swap the first level's bricks for a WALL_COLS x WALL_ROWS wall of small bricks."""
+    game.new_game(seed=SEED)
+    pitch = WALL_BRICK_SIZE[0] + WALL_PADDING
+    cells = bytes((row // 4) % 10 for row in range(WALL_ROWS) for _ in range(WALL_COLS))
+    game.set_brick_field(BrickField.from_cells(
+        WALL_COLS, WALL_ROWS, cells, game.assets,
+        origin=((SCREEN_WIDTH - WALL_COLS * pitch) // 2, BRICK_TOP_OFFSET),
+        brick_size=WALL_BRICK_SIZE, padding=WALL_PADDING
+    ))
+
+
+def setup_particles(game, rng):
+    """Keep PARTICLE_TARGET particles alive by spawning bursts at random points."""
+    game.new_game(seed=SEED)
+    types = len(game.assets.particle_fades)
+    
+    def top_up():
+        missing = PARTICLE_TARGET - len(game.particles)
+        while missing > 0:
+            count = min(missing, 50)
+            game.particles.spawn(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, 400), rng.randrange(types), count)
+            missing -= count
+    return top_up
+
+
+def setup_bullets(game, rng):
+    """Keep the bullet power-up active so the AI fires as fast as the cooldown allows."""
+    game.new_game(seed=SEED)
+    
+    def hold_power_up():
+        game.powerup_manager.activate(POWERUP_BULLET, game.sim_time, POWERUP_DURATION)
+    return hold_power_up
+
+
+def setup_powerups(game, rng):
+    """Keep POWERUP_TARGET power-ups falling at random points."""
+    game.new_game(seed=SEED)
+    manager = game.powerup_manager
+    
+    def top_up():
+        for _ in range(POWERUP_TARGET - len(manager.powerup_group)):
+            powerup = manager.pool.acquire(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, 300),
+                                           game.assets.star, rng=rng)
+            manager.powerup_group.add(powerup)
+    return top_up
+
+
+# name -> setup(game, rng), which may return a hook run before every frame
+SCENARIOS = {
+    "level5": setup_level5,
+    "wall": setup_wall,
+    "particles": setup_particles,
+    "bullets": setup_bullets,
+    "powerups": setup_powerups,
+}
+
+
+def _timings(values):
+    """Summarize a list of milliseconds, or None if it is empty."""
+    if not values:
+        return None
+    return {
+        "mean": sum(values) / len(values),
+        **{f"p{pct}": percentile(values, pct) for pct in PERCENTILES},
+        "max": max(values),
+    }
+
+
+def run_scenario(game, name, frames, alloc_frames):
+    """
+    Play one scenario for a number of frames. Returns its report: update
+    and draw times (ms), garbage collections and allocated-block growth
+    during the timed frames, then the per-frame peak of transient
+    allocations over alloc_frames more frames traced with tracemalloc.
+    """
+    rng = random.Random(SEED)
+    game.input_source = TrackingInput(seed=SEED)
+    hook = SCENARIOS[name](game, rng)
+    
+    def frame():
+        game.lives = INITIAL_LIVES  # Never end the scenario on a lost ball
+        if hook:
+            hook()
+        if game.state == STATE_LEVEL_COMPLETE:
+            game.advance_level()  # Untimed; the scenario goes on with the next level
+        if game.state != STATE_PLAYING:
+            raise RuntimeError(f"Scenario {name} left play ({game.state}) "
+                               f"after {len(update_ms) + len(alloc_kb)} frames")
+        start = time.perf_counter()
+        game._step(game.dt)
+        middle = time.perf_counter()
+        game._draw()
+        return (middle - start) * 1000, (time.perf_counter() - middle) * 1000
+    
+    update_ms, draw_ms, alloc_kb = [], [], []
+    gc.collect()
+    collections = [stats["collections"] for stats in gc.get_stats()]
+    blocks = sys.getallocatedblocks()
+    
+    for _ in range(frames):
+        update, draw = frame()
+        update_ms.append(update)
+        draw_ms.append(draw)
+    
+    blocks = sys.getallocatedblocks() - blocks
+    collections = [stats["collections"] - before for stats, before in zip(gc.get_stats(), collections)]
+    
+    tracemalloc.start()
+    for _ in range(alloc_frames):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        frame()
+        alloc_kb.append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+    tracemalloc.stop()
+    
+    return {
+        "frames": len(update_ms),
+        "update_ms": _timings(update_ms),
+        "draw_ms": _timings(draw_ms),
+        "gc_collections": collections,
+        "allocated_blocks_delta": blocks,
+        "frame_alloc_peak_kb": _timings(alloc_kb),
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark Breakout update and draw under stress scenarios.")
+    parser.add_argument("--frames", type=int, default=600, help="timed frames per scenario")
+    parser.add_argument("--alloc-frames", type=int, default=60,
+                        help="extra frames per scenario traced for allocations")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable; default: all)")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON ('-' for stdout)")
+    args = parser.parse_args()
+    if args.frames < 1:
+        parser.error("--frames must be at least 1")
+    
+    game = HeadlessGame()
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = run_scenario(game, name, args.frames, args.alloc_frames)
+    
+    # Keep stdout clean for the JSON report when it goes there
+    table = sys.stderr if args.json == "-" else sys.stdout
+    print(f"{'scenario':<10} {'frames':>6} {'update mean/p50/p99':>22} {'draw mean/p50/p99':>22} "
+          f"{'gc0/1/2':>10} {'alloc kB':>9}", file=table)
+    for name, result in results.items():
+        update, draw = result["update_ms"], result["draw_ms"]
+        alloc = result["frame_alloc_peak_kb"]
+        print(f"{name:<10} {result['frames']:>6} "
+              f"{update['mean']:>6.2f}/{update['p50']:>6.2f}/{update['p99']:>6.2f}ms "
+              f"{draw['mean']:>6.2f}/{draw['p50']:>6.2f}/{draw['p99']:>6.2f}ms "
+              f"{'/'.join(map(str, result['gc_collections'])):>10} "
+              f"{alloc['mean'] if alloc else 0:>9.1f}", file=table)
+    
+    if args.json:
+        report = {
+            "version": REPORT_VERSION,
+            "seed": SEED,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "scenarios": results,
+        }
+        if args.json == "-":
+            print(json.dumps(report))
+        else:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Startup benchmark for Breakout.
+Launches startup_profile.py in fresh processes with the SDL dummy
+drivers and reports percentiles for every profiled section, so startup
+regressions show up before release.
+
+Usage:
+    python bench_startup.py --runs 20
+    python bench_startup.py --runs 50 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile of a non-empty list."""
+    values = sorted(values)
+    rank = (len(values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def run_once(headless=False):
+    """Profile one startup in a new interpreter and return its report."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_profile.py")
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    command = [sys.executable, script, "--json", "-"]
+    if headless:
+        command.append("--headless")
+    result = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    # The report is the last line; anything before it is game output
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(reports):
+    """Collect per-section percentiles across runs."""
+    samples = {"total": [report["total_ms"] for report in reports]}
+    for report in reports:
+        # A name can repeat within a run; sum it so each run gives one sample
+        durations = {}
+        for entry in report["sections"]:
+            durations[entry["name"]] = durations.get(entry["name"], 0) + entry["duration_ms"]
+        for name, duration in durations.items():
+            samples.setdefault(name, []).append(duration)
+    
+    return {
+        name: {
+            "runs": len(values),
+            "min": min(values),
+            "max": max(values),
+            **{f"p{pct}": percentile(values, pct) for pct in PERCENTILES},
+        }
+        for name, values in samples.items()
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark Breakout startup time.")
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh launches")
+    parser.add_argument("--headless", action="store_true",
+                        help="profile headless startup (no audio)")
+    parser.add_argument("--json", metavar="PATH", help="write the summary as JSON")
+    args = parser.parse_args()
+    
+    reports = [run_once(headless=args.headless) for _ in range(args.runs)]
+    summary = summarize(reports)
+    
+    # Slowest sections first, by median
+    names = sorted(summary, key=lambda name: -summary[name]["p50"])
+    header = f"{'section':<40}" + "".join(f"{'p' + str(pct):>10}" for pct in PERCENTILES) + f"{'max':>10}"
+    print(header)
+    for name in names:
+        stats = summary[name]
+        print(f"{name:<40}" + "".join(f"{stats[f'p{pct}']:>8.2f}ms" for pct in PERCENTILES)
+              + f"{stats['max']:>8.2f}ms")
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "headless": args.headless, "sections": summary}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Compact brick storage for Breakout.
+A level's bricks live in flat typed arrays indexed by grid cell rather
+than as one Sprite per brick. Brick objects are thin views created only
+for the bricks that collision or scoring code actually touches.
+"""
+
+from array import array
+import pygame
+from config import (
+    SCREEN_WIDTH, BRICK_WIDTH, BRICK_HEIGHT, BRICK_PADDING, BRICK_TOP_OFFSET,
+    BRICK_LEFT_OFFSET, BRICK_AREA_BOTTOM, BRICK_MIN_SIZE, BRICK_HEALTH_NORMAL
+)
+from entities import Brick
+
+EMPTY = -1  # Brick type of an empty cell
+
+# Byte translation tables for bulk decoding: negative type -> empty cell
+_ALIVE_TABLE = bytes(1 if byte < 0x80 else 0 for byte in range(256))
+_HEALTH_TABLE = bytes([0, BRICK_HEALTH_NORMAL]) + bytes(254)
+
+# Area the brick grid must fit in: the standard 9-column grid fills its width
+_AREA_WIDTH = SCREEN_WIDTH - 2 * BRICK_LEFT_OFFSET
+_AREA_HEIGHT = BRICK_AREA_BOTTOM - BRICK_TOP_OFFSET
+
+
+def field_layout(cols, rows):
+    """
+    Get the BrickField keyword arguments (origin, brick_size, padding)
+    that fit a cols x rows level in the brick area. Levels that fit at
+    the standard brick size keep it; larger ones get bricks (and gaps)
+    shrunk just enough to fit. The grid is centred horizontally.
+    Returns None if the bricks would be smaller than BRICK_MIN_SIZE.
+    """
+    standard_x = BRICK_WIDTH + BRICK_PADDING
+    standard_y = BRICK_HEIGHT + BRICK_PADDING
+    pitch_x = min(standard_x, _AREA_WIDTH // cols) if cols else standard_x
+    pitch_y = min(standard_y, _AREA_HEIGHT // rows) if rows else standard_y
+    padding = min(BRICK_PADDING, pitch_x * BRICK_PADDING // standard_x, pitch_y * BRICK_PADDING // standard_y)
+    
+    brick_size = (pitch_x - padding, pitch_y - padding)
+    if min(brick_size) < BRICK_MIN_SIZE:
+        return None
+    return {
+        "origin": ((SCREEN_WIDTH - cols * pitch_x) // 2, BRICK_TOP_OFFSET),
+        "brick_size": brick_size,
+        "padding": padding,
+    }
+
+
+class BrickField:
+    """Struct-of-arrays brick grid.
+    
+    Cell (col, row) has index row * cols + col in the types, health and
+    alive arrays. The grid pitch is the level layout pitch, so the
+    field is also the spatial index: the cells under a rect are found
+    arithmetically. The remaining-brick count is kept up to date, so
+    "level complete" is O(1).
+    """
+    
+    def __init__(self, cols, rows, assets,
+                 origin=(BRICK_LEFT_OFFSET, BRICK_TOP_OFFSET),
+                 brick_size=(BRICK_WIDTH, BRICK_HEIGHT), padding=BRICK_PADDING):
+        self.cols = cols
+        self.rows = rows
+        self.assets = assets
+        self.origin_x, self.origin_y = origin
+        self.brick_w, self.brick_h = brick_size
+        # Size to scale brick sprites to; None keeps the standard sprites
+        self.sprite_size = None if brick_size == (BRICK_WIDTH, BRICK_HEIGHT) else brick_size
+        self.pitch_x = self.brick_w + padding
+        self.pitch_y = self.brick_h + padding
+        
+        size = cols * rows
+        self.types = array("b", [EMPTY]) * size
+        self.health = array("b", [0]) * size
+        self.alive = bytearray(size)  # 1 while the cell holds a brick; shared with BallArray
+        self.remaining = 0
+        self.views = {}  # index -> Brick, created on first use
+    
+    @classmethod
+    def from_pattern(cls, pattern, assets, **kwargs):
+        """Build a field from rows of brick types (negative means empty)."""
+        cols = max((len(row) for row in pattern), default=0)
+        field = cls(cols, len(pattern), assets, **kwargs)
+        for row_idx, row in enumerate(pattern):
+            for col_idx, brick_type in enumerate(row):
+                if brick_type >= 0:
+                    field.place(col_idx, row_idx, brick_type)
+        return field
+    
+    @classmethod
+    def from_cells(cls, cols, rows, cells, assets, **kwargs):
+        """
+        Build a field from row-major brick type bytes (as stored in a
+        level pack). Decoding is a few bulk byte operations, no per-brick
+        Python work.
+        """
+        field = cls(cols, rows, assets, **kwargs)
+        field.types = array("b")
+        field.types.frombytes(cells)
+        field.alive = bytearray(bytes(cells).translate(_ALIVE_TABLE))
+        field.health = array("b")
+        field.health.frombytes(field.alive.translate(_HEALTH_TABLE))
+        field.remaining = field.alive.count(1)
+        return field
+    
+    def place(self, col, row, brick_type, health=BRICK_HEALTH_NORMAL):
+        """Put a brick in an empty cell."""
+        index = row * self.cols + col
+        if not self.alive[index]:
+            self.remaining += 1
+        self.types[index] = brick_type
+        self.health[index] = health
+        self.alive[index] = 1
+    
+    def cell_rect(self, index):
+        """Get the screen rect of the brick in a cell."""
+        row, col = divmod(index, self.cols)
+        return pygame.Rect(
+            self.origin_x + col * self.pitch_x, self.origin_y + row * self.pitch_y,
+            self.brick_w, self.brick_h
+        )
+    
+    def get_image(self, index):
+        """Get the sprite for a cell's brick, cracked once it has been hit."""
+        return self.assets.get_brick_sprite(
+            self.types[index], is_cracked=self.health[index] < BRICK_HEALTH_NORMAL,
+            size=self.sprite_size
+        )
+    
+    def brick(self, index):
+        """Get the Brick view of a cell (the same object on every call)."""
+        view = self.views.get(index)
+        if view is None:
+            view = Brick(self, index)
+            self.views[index] = view
+        return view
+    
+    def remove(self, brick):
+        """Remove a destroyed brick (no-op if it is already gone)."""
+        if self.alive[brick.index]:
+            self.alive[brick.index] = 0
+            self.remaining -= 1
+    
+    def _cells(self, rect):
+        """Get the indices of occupied cells under rect, in row-major order."""
+        col0 = max((rect.left - self.origin_x) // self.pitch_x, 0)
+        col1 = min((rect.right - 1 - self.origin_x) // self.pitch_x, self.cols - 1)
+        row0 = max((rect.top - self.origin_y) // self.pitch_y, 0)
+        row1 = min((rect.bottom - 1 - self.origin_y) // self.pitch_y, self.rows - 1)
+        
+        alive = self.alive
+        for row in range(row0, row1 + 1):
+            base = row * self.cols
+            for index in range(base + col0, base + col1 + 1):
+                if alive[index]:
+                    yield index
+    
+    def query(self, rect):
+        """Get the bricks colliding with rect, in level (row-major) order."""
+        return [
+            self.brick(index) for index in self._cells(rect)
+            if rect.colliderect(self.cell_rect(index))
+        ]
+    
+    def draw_items(self, area=None):
+        """
+        Get (image, rect) pairs for the live bricks, optionally only those
+        overlapping area. No Brick views are created.
+        """
+        if area is None:
+            indices = [i for i, alive in enumerate(self.alive) if alive]
+        else:
+            indices = [i for i in self._cells(area) if area.colliderect(self.cell_rect(i))]
+        return [(self.get_image(i), self.cell_rect(i)) for i in indices]
+    
+    def is_clear(self):
+        """Check if every brick has been destroyed."""
+        return self.remaining == 0
+    
+    def __len__(self):
+        return self.remaining
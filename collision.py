@@ -0,0 +1,136 @@
+"""
+Continuous collision detection for Breakout.
+Sweeps the ball's box along its velocity and resolves contacts in
+time-of-impact order, so fast balls cannot tunnel through bricks or
+the paddle.
+"""
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, BALL_MAX_CONTACTS
+
+# Contact kinds reported to the contact callback
+CONTACT_WALL = "wall"
+CONTACT_PADDLE = "paddle"
+CONTACT_BRICK = "brick"
+
+# Walls are thick boxes just outside the screen; the bottom stays open
+_WALL_THICKNESS = 1000
+WALLS = (
+    pygame.Rect(-_WALL_THICKNESS, -_WALL_THICKNESS, _WALL_THICKNESS, SCREEN_HEIGHT + 2 * _WALL_THICKNESS),
+    pygame.Rect(SCREEN_WIDTH, -_WALL_THICKNESS, _WALL_THICKNESS, SCREEN_HEIGHT + 2 * _WALL_THICKNESS),
+    pygame.Rect(-_WALL_THICKNESS, -_WALL_THICKNESS, SCREEN_WIDTH + 2 * _WALL_THICKNESS, _WALL_THICKNESS),
+)
+
+
+def sweep_box(x, y, w, h, dx, dy, rect):
+    """
+    Sweep a w*h box with top-left (x, y) by (dx, dy) against a static rect.
+    Returns (t, nx, ny) for the first contact, where t in [0, 1) is the
+    fraction of the move and (nx, ny) the face normal, or None.
+    A box already overlapping the rect reports t = 0 on the face it entered through.
+    """
+    # Minkowski sum: test the top-left point against the rect grown by the box size
+    left = rect.left - w
+    right = rect.right
+    top = rect.top - h
+    bottom = rect.bottom
+    
+    if dx > 0:
+        tx_entry, tx_exit = (left - x) / dx, (right - x) / dx
+    elif dx < 0:
+        tx_entry, tx_exit = (right - x) / dx, (left - x) / dx
+    elif left < x < right:
+        tx_entry, tx_exit = float("-inf"), float("inf")
+    else:
+        return None
+    
+    if dy > 0:
+        ty_entry, ty_exit = (top - y) / dy, (bottom - y) / dy
+    elif dy < 0:
+        ty_entry, ty_exit = (bottom - y) / dy, (top - y) / dy
+    elif top < y < bottom:
+        ty_entry, ty_exit = float("-inf"), float("inf")
+    else:
+        return None
+    
+    entry = max(tx_entry, ty_entry)
+    exit_ = min(tx_exit, ty_exit)
+    if entry >= exit_ or entry >= 1 or exit_ <= 0:
+        return None
+    
+    if tx_entry > ty_entry:
+        return max(entry, 0.0), (-1 if dx > 0 else 1), 0
+    return max(entry, 0.0), 0, (-1 if dy > 0 else 1)
+
+
+def sweep_ball(ball, paddle_rect, brick_field, on_contact, fraction=1.0):
+    """
+    Move an active ball by fraction of its velocity, bouncing off walls,
+    the paddle and bricks in the order they are reached.
+    
+    Each contact reflects the ball, calls on_contact(kind, target) and the
+    rest of the move continues from the contact point, up to
+    BALL_MAX_CONTACTS contacts per call. Bricks are queried from the field
+    after every contact, so bricks destroyed by on_contact stop blocking.
+    The object just bounced off is skipped on the next pass so a ball that
+    started inside it cannot hit it twice.
+    """
+    pos = ball.pos
+    w, h = ball.rect.size
+    remaining = fraction
+    last = None
+    
+    for _ in range(BALL_MAX_CONTACTS):
+        dx = ball.velocity.x * remaining
+        dy = ball.velocity.y * remaining
+        if dx == 0 and dy == 0:
+            break
+        
+        best = None
+        
+        for wall in WALLS:
+            if wall is last:
+                continue
+            hit = sweep_box(pos.x, pos.y, w, h, dx, dy, wall)
+            if hit and (best is None or hit[0] < best[0]):
+                best = hit + (CONTACT_WALL, wall)
+        
+        if paddle_rect is not None and dy > 0 and last is not paddle_rect:
+            hit = sweep_box(pos.x, pos.y, w, h, dx, dy, paddle_rect)
+            if hit and (best is None or hit[0] < best[0]):
+                best = hit + (CONTACT_PADDLE, paddle_rect)
+        
+        # Only bricks under the swept box can be hit
+        swept = pygame.Rect(
+            int(min(pos.x, pos.x + dx)), int(min(pos.y, pos.y + dy)),
+            int(abs(dx)) + w + 2, int(abs(dy)) + h + 2
+        )
+        for brick in brick_field.query(swept):
+            if brick is last:
+                continue
+            hit = sweep_box(pos.x, pos.y, w, h, dx, dy, brick.rect)
+            if hit and (best is None or hit[0] < best[0]):
+                best = hit + (CONTACT_BRICK, brick)
+        
+        if best is None:
+            pos.x += dx
+            pos.y += dy
+            break
+        
+        t, nx, ny, kind, target = best
+        pos.x += dx * t
+        pos.y += dy * t
+        remaining *= 1 - t
+        last = target
+        
+        if kind == CONTACT_PADDLE:
+            ball.deflect_from_paddle(paddle_rect)
+        else:
+            if nx:
+                ball.velocity.x = abs(ball.velocity.x) * nx
+            if ny:
+                ball.velocity.y = abs(ball.velocity.y) * ny
+        
+        on_contact(kind, None if kind == CONTACT_PADDLE else target)
+    
+    ball.sync_rect()
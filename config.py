@@ -2,12 +2,20 @@
 Game configuration constants for Breakout.
 """
 
+import os
+
 # Screen settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 TITLE = "Brick Breaker"
 
+# Simulation clock
+SIM_HZ = 60  # Physics ticks per second, independent of the render FPS
+SIM_STEP = 1000 / SIM_HZ  # Milliseconds per physics tick
+MOVE_FRAME_MS = 1000 / 60  # Speeds below are in pixels per frame of this length
+MAX_FRAME_TIME = 250  # Cap on simulated time per rendered frame (ms)
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -26,6 +34,7 @@ BALL_SIZE = 32
 BALL_SPEED_INITIAL = 6
 BALL_SPEED_MIN = 4
 BALL_SPEED_MAX = 12
+BALL_MAX_CONTACTS = 4  # Contacts resolved per ball per tick by the swept collision solver
 
 # Brick settings
 BRICK_WIDTH = 96
@@ -35,6 +44,9 @@ BRICK_COLS = 9
 BRICK_PADDING = 4
 BRICK_TOP_OFFSET = 80
 BRICK_LEFT_OFFSET = (SCREEN_WIDTH - (BRICK_COLS * (BRICK_WIDTH + BRICK_PADDING))) // 2
+BRICK_AREA_BOTTOM = PADDLE_Y - 240  # Lowest edge of the brick grid; larger levels get smaller bricks
+BRICK_MIN_SIZE = 2  # Smallest brick edge in pixels; levels needing smaller bricks are rejected
+BRICK_TYPES = 10  # Brick types 0-9 (sprites and score values)
 
 # Brick health
 BRICK_HEALTH_NORMAL = 2  # Two hits: complete -> cracked -> destroyed
@@ -58,9 +70,16 @@ POWERUP_DURATION = 8000  # 8 seconds in milliseconds
 POWERUP_SLOW = "slow"
 POWERUP_FAST = "fast"
 POWERUP_BULLET = "bullet"
+POWERUP_MULTIBALL = "multiball"
+
+# Multi-ball settings
+MULTIBALL_SPLIT = 2  # Extra balls released by a multi-ball power-up
+MULTIBALL_STRESS_COUNT = 100  # Extra balls added by the F5 stress key
 
 # Bullet settings
 BULLET_SPEED = 12
+BULLET_WIDTH = 19
+BULLET_HEIGHT = 41
 BULLET_COOLDOWN = 300  # milliseconds between shots
 
 # Particle settings
@@ -69,6 +88,7 @@ PARTICLE_SIZE = 16
 PARTICLE_SPEED = 5
 PARTICLE_LIFETIME = 1000  # milliseconds
 PARTICLE_GRAVITY = 0.3
+PARTICLE_ALPHA_LEVELS = 32  # Pre-faded frames per particle type (more = smoother fade, more RAM)
 
 # Speed modifiers
 SLOW_MULTIPLIER = 0.6
@@ -77,6 +97,20 @@ FAST_MULTIPLIER = 1.5
 # Paddle display durations (milliseconds)
 PADDLE_SCORE_DISPLAY_TIME = 1500
 
+# Rendering
+RENDER_MODE_FULL = "full"    # Redraw and flip the whole screen every frame
+RENDER_MODE_DIRTY = "dirty"  # Redraw and present only regions that changed
+RENDER_MODE = RENDER_MODE_FULL
+DIRTY_TILE_SIZE = 32  # Dirty regions are tracked on a grid of this many pixels
+TEXT_CACHE_SIZE = 128  # Rendered text surfaces kept by the LRU text cache
+ATLAS_SHEET_SIZE = 1024  # Max width/height of a packed sprite sheet
+ATLAS_PADDING = 2  # Transparent gap between packed sprites
+SPRITE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "sprites")
+IDLE_FPS = 15  # Frame cap on static screens (menu, pause, game over, level complete, win)
+FRAME_PROFILE_SPANS = 65536  # Spans kept by the frame profiler's ring buffer (~1000 frames)
+FRAME_GRAPH_FRAMES = 120  # Frames shown by the frame-time graph (F3)
+FRAME_GRAPH_SIZE = (240, 80)
+
 # Game states
 STATE_MENU = "menu"
 STATE_PLAYING = "playing"
@@ -87,3 +121,21 @@ STATE_WIN = "win"
 
 # Number of levels
 NUM_LEVELS = 5
+LEVEL_PACK_PATH = None  # Level pack file (see levelpack.py) to play instead of the built-in levels
+ENDLESS_SEED = None  # Seed for endless mode (procedural levels after the last one); None = off
+
+# Procedural levels (endless mode)
+PROCGEN_MAX_ROWS = 8  # Brick rows once difficulty has fully ramped up
+PROCGEN_RAMP_LEVELS = 20  # Levels over which density and brick types ramp up
+PROCGEN_LOOKAHEAD = 3  # Levels generated ahead in the background
+PROCGEN_CACHE_SIZE = 16  # Generated levels kept in memory
+
+# Input recording
+RECORD_FLUSH_TICKS = 600  # Recordings are flushed to disk this often (10s of game time)
+
+# Telemetry (frame-time log for long-running sessions)
+TELEMETRY_WINDOW_S = 30  # Seconds aggregated into each log line
+TELEMETRY_BUCKETS_MS = (8, 12, 16.7, 20, 25, 33.3, 50, 100, 250)  # Frame-time histogram upper bounds
+TELEMETRY_MAX_BYTES = 10 * 1024 * 1024  # Log size that triggers rotation
+TELEMETRY_BACKUPS = 5  # Rotated logs kept (log.1 ... log.5)
+TELEMETRY_QUEUE_SIZE = 64  # Windows waiting for the writer before new ones are dropped
@@ -0,0 +1,112 @@
+"""
+Input sources for Breakout.
+Decouple the paddle and bullet controls from the mouse so the game
+can also be driven by scripts and simple AIs.
+"""
+
+from collections import deque
+import pygame
+import random
+from config import PADDLE_WIDTH
+
+
+class InputState:
+    """Player input sampled for a single update tick."""
+    
+    __slots__ = ("target_x", "fire", "launch", "stress")
+    
+    def __init__(self, target_x, fire=False, launch=False, stress=False):
+        self.target_x = target_x  # Paddle target x (screen pixels)
+        self.fire = fire          # Fire button held
+        self.launch = launch      # Request to launch the ball this tick
+        self.stress = stress      # Request a multi-ball stress burst this tick
+
+
+class MouseInput:
+    """Live input read from the mouse."""
+    
+    def poll(self, game):
+        """Sample the mouse for the current tick."""
+        return InputState(
+            pygame.mouse.get_pos()[0],
+            fire=pygame.mouse.get_pressed()[0]
+        )
+
+
+class ScriptedInput:
+    """Input replayed from a script of (target_x, fire, launch) tuples.
+    
+    The script may be a sequence indexed by tick (the last entry is held
+    once it runs out) or a callable taking (tick, game).
+    """
+    
+    def __init__(self, script):
+        self.script = script
+        self.tick = 0
+    
+    def poll(self, game):
+        """Return the scripted input for the current tick."""
+        if callable(self.script):
+            entry = self.script(self.tick, game)
+        else:
+            entry = self.script[min(self.tick, len(self.script) - 1)]
+        self.tick += 1
+        
+        if isinstance(entry, InputState):
+            return entry
+        return InputState(*entry)
+
+
+class TrackingInput:
+    """Simple AI that keeps the paddle under the ball.
+    
+    Launches the ball as soon as it rests on the paddle and holds fire
+    so bullet power-ups are always used. After every paddle bounce it
+    picks a new random aim offset so the ball does not settle into a
+    vertical loop.
+    
+    The defaults play perfectly (the paddle outruns any ball). Skill
+    knobs make it miss like a player would: reaction is a delay in ticks
+    before it sees where the ball is, max_speed caps how far it moves
+    the paddle per tick, and noise adds an aiming error (standard
+    deviation as a fraction of paddle width) drawn after each bounce.
+    """
+    
+    def __init__(self, seed=None, spread=0.4, reaction=0, max_speed=None, noise=0.0):
+        self.rng = random.Random(seed)
+        self.spread = spread  # Max aim offset as a fraction of paddle width
+        self.reaction = reaction
+        self.max_speed = max_speed
+        self.noise = noise
+        self.offset = 0
+        self.last_vy = 0
+        self.seen_x = deque(maxlen=reaction + 1)  # Ball x over the last reaction ticks
+    
+    def poll(self, game):
+        """Track the ball's x position."""
+        ball = game.ball
+        if ball is None:
+            return InputState(game.paddle.rect.centerx if game.paddle else 0)
+        
+        # Re-aim after each bounce off the paddle
+        if self.last_vy > 0 and ball.velocity.y < 0:
+            half = PADDLE_WIDTH * self.spread
+            self.offset = self.rng.uniform(-half, half)
+            if self.noise:
+                self.offset += self.rng.gauss(0, PADDLE_WIDTH * self.noise)
+        self.last_vy = ball.velocity.y
+        
+        if not ball.active:
+            self.seen_x.clear()  # The ball is on the paddle; start watching afresh on launch
+        self.seen_x.append(ball.rect.centerx)
+        target_x = self.seen_x[0] + self.offset
+        
+        if self.max_speed is not None and game.paddle:
+            paddle_x = game.paddle.rect.centerx
+            target_x = min(max(target_x, paddle_x - self.max_speed), paddle_x + self.max_speed)
+        
+        return InputState(
+            target_x,
+            fire=True,
+            launch=not ball.active
+        )
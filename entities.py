@@ -8,26 +8,37 @@ import math
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, PADDLE_Y, PADDLE_SPEED,
     BALL_SPEED_INITIAL, BALL_SPEED_MIN, BALL_SPEED_MAX,
-    BRICK_WIDTH, BRICK_HEIGHT, BRICK_HEALTH_NORMAL,
+    BRICK_WIDTH, BRICK_HEIGHT,
     SCORE_VALUES, PARTICLE_SPEED, PARTICLE_LIFETIME, PARTICLE_GRAVITY,
     BULLET_SPEED, SLOW_MULTIPLIER, FAST_MULTIPLIER,
-    PADDLE_SCORE_DISPLAY_TIME
+    PADDLE_SCORE_DISPLAY_TIME, MOVE_FRAME_MS
 )
+from pool import PooledSprite
+
+
+def interpolate_topleft(sprite, alpha):
+    """Blend a sprite's previous and current top-left for drawing between ticks."""
+    px, py = sprite.prev_topleft
+    x, y = sprite.rect.topleft
+    return (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
 
 
 class Ball(pygame.sprite.Sprite):
     """The game ball with physics and collision handling."""
     
-    def __init__(self, x, y, image):
+    def __init__(self, x, y, image, rng=random):
         super().__init__()
         self.image = image
+        self.rng = rng  # Source of serve and launch angles
         self.rect = self.image.get_rect(center=(x, y))
+        self.pos = pygame.math.Vector2(self.rect.topleft)  # Sub-pixel position while active
+        self.prev_topleft = self.rect.topleft  # Position at the previous tick, for interpolation
         self.base_speed = BALL_SPEED_INITIAL
         self.speed = self.base_speed
         self.speed_multiplier = 1.0
         
         # Start with random angle upward
-        angle = random.uniform(-60, 60)  # degrees from vertical
+        angle = self.rng.uniform(-60, 60)  # degrees from vertical
         rad = math.radians(angle - 90)  # Convert to radians, -90 for upward
         self.velocity = pygame.math.Vector2(
             math.cos(rad) * self.speed,
@@ -36,8 +47,13 @@ class Ball(pygame.sprite.Sprite):
         
         self.active = False  # Ball attached to paddle until launched
     
-    def update(self, paddle_rect=None, wall_sound=None):
-        """Update ball position and handle wall collisions."""
+    def update(self, paddle_rect=None):
+        """
+        Follow the paddle until launched, then apply the speed multiplier.
+        Movement and bounces are handled by collision.sweep_ball.
+        """
+        self.prev_topleft = self.rect.topleft
+        
         if not self.active:
             # Ball follows paddle
             if paddle_rect:
@@ -49,61 +65,38 @@ class Ball(pygame.sprite.Sprite):
         current_speed = self.speed * self.speed_multiplier
         if self.velocity.length() > 0:
             self.velocity = self.velocity.normalize() * current_speed
-        
-        # Move ball
-        self.rect.x += self.velocity.x
-        self.rect.y += self.velocity.y
-        
-        # Wall collisions
-        hit_wall = False
-        if self.rect.left <= 0:
-            self.rect.left = 0
-            self.velocity.x = abs(self.velocity.x)
-            hit_wall = True
-        elif self.rect.right >= SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
-            self.velocity.x = -abs(self.velocity.x)
-            hit_wall = True
-        
-        if self.rect.top <= 0:
-            self.rect.top = 0
-            self.velocity.y = abs(self.velocity.y)
-            hit_wall = True
-            
-        if hit_wall and wall_sound:
-            wall_sound.play()
+    
+    def sync_rect(self):
+        """Snap the integer rect to the sub-pixel position."""
+        self.rect.topleft = (round(self.pos.x), round(self.pos.y))
     
     def launch(self):
         """Launch the ball."""
         self.active = True
-        angle = random.uniform(-45, 45)
+        self.pos.update(self.rect.topleft)
+        angle = self.rng.uniform(-45, 45)
         rad = math.radians(angle - 90)
         self.velocity = pygame.math.Vector2(
             math.cos(rad) * self.speed,
             math.sin(rad) * self.speed
         )
     
-    def collide_paddle(self, paddle_rect):
-        """Handle paddle collision with angle reflection."""
-        if self.rect.colliderect(paddle_rect) and self.velocity.y > 0:
-            # Calculate hit position relative to paddle center (-1 to 1)
-            relative_hit = (self.rect.centerx - paddle_rect.centerx) / (paddle_rect.width / 2)
-            relative_hit = max(-1, min(1, relative_hit))  # Clamp
-            
-            # Calculate reflection angle (max 60 degrees from vertical)
-            angle = relative_hit * 60
-            rad = math.radians(angle - 90)
-            
-            current_speed = self.velocity.length()
-            self.velocity = pygame.math.Vector2(
-                math.cos(rad) * current_speed,
-                math.sin(rad) * current_speed
-            )
-            
-            # Ensure ball is above paddle
-            self.rect.bottom = paddle_rect.top - 1
-            return True
-        return False
+    def deflect_from_paddle(self, paddle_rect):
+        """Reflect off the paddle at an angle set by where the ball hit it."""
+        # Calculate hit position relative to paddle center (-1 to 1)
+        center_x = self.pos.x + self.rect.width / 2
+        relative_hit = (center_x - paddle_rect.centerx) / (paddle_rect.width / 2)
+        relative_hit = max(-1, min(1, relative_hit))  # Clamp
+        
+        # Calculate reflection angle (max 60 degrees from vertical)
+        angle = relative_hit * 60
+        rad = math.radians(angle - 90)
+        
+        current_speed = self.velocity.length()
+        self.velocity = pygame.math.Vector2(
+            math.cos(rad) * current_speed,
+            math.sin(rad) * current_speed
+        )
     
     def is_out(self):
         """Check if ball fell off screen."""
@@ -114,6 +107,7 @@ class Ball(pygame.sprite.Sprite):
         self.active = False
         self.rect.centerx = paddle_rect.centerx
         self.rect.bottom = paddle_rect.top - 5
+        self.prev_topleft = self.rect.topleft
         self.speed_multiplier = 1.0
     
     def set_slow(self):
@@ -137,6 +131,8 @@ class Paddle(pygame.sprite.Sprite):
         self.assets = assets
         self.image = assets.paddle_default
         self.rect = self.image.get_rect(center=(x, y))
+        self.prev_topleft = self.rect.topleft
+        self.x = float(self.rect.centerx)  # Sub-pixel centre x
         
         self.speed = PADDLE_SPEED
         
@@ -148,25 +144,27 @@ class Paddle(pygame.sprite.Sprite):
         self.active_powerup = None
         self.powerup_timer = 0
     
-    def update(self, dt=0):
-        """Update paddle based on mouse position."""
-        mouse_x = pygame.mouse.get_pos()[0]
+    def update(self, dt=MOVE_FRAME_MS, target_x=None):
+        """Update paddle towards target_x (defaults to the mouse position)."""
+        self.prev_topleft = self.rect.topleft
+        
+        if target_x is None:
+            target_x = pygame.mouse.get_pos()[0]
         
-        # Smoothly follow mouse
-        target_x = mouse_x
-        dx = target_x - self.rect.centerx
+        # Smoothly follow target
+        dx = target_x - self.x
+        step = self.speed * dt / MOVE_FRAME_MS
         
         # Move towards target
-        if abs(dx) > self.speed:
-            self.rect.centerx += self.speed if dx > 0 else -self.speed
+        if abs(dx) > step:
+            self.x += step if dx > 0 else -step
         else:
-            self.rect.centerx = target_x
+            self.x = target_x
         
         # Keep paddle on screen
-        if self.rect.left < 0:
-            self.rect.left = 0
-        elif self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
+        half_width = self.rect.width / 2
+        self.x = max(half_width, min(SCREEN_WIDTH - half_width, self.x))
+        self.rect.centerx = round(self.x)
         
         # Update score display timer
         if self.score_display is not None:
@@ -208,52 +206,73 @@ class Paddle(pygame.sprite.Sprite):
         self.powerup_timer = duration
 
 
-class Brick(pygame.sprite.Sprite):
-    """A destructible brick."""
+class Brick:
+    """A destructible brick: a lightweight view of one cell of a BrickField.
     
-    def __init__(self, x, y, brick_type, assets):
-        super().__init__()
-        self.brick_type = brick_type
-        self.assets = assets
-        self.health = BRICK_HEALTH_NORMAL
-        
-        self.image = assets.get_brick_sprite(brick_type, is_cracked=False)
-        self.rect = self.image.get_rect(topleft=(x, y))
-        
-        self.score = SCORE_VALUES[brick_type] if brick_type < len(SCORE_VALUES) else 50
+    The brick's type and health live in the field's arrays; the view only
+    holds the cell index and its rect, so thousands of bricks cost a few
+    bytes each until something needs to look at them.
+    """
+    
+    __slots__ = ("field", "index", "rect")
+    
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+        self.rect = field.cell_rect(index)
+    
+    @property
+    def brick_type(self):
+        return self.field.types[self.index]
+    
+    @property
+    def health(self):
+        return self.field.health[self.index]
+    
+    @property
+    def score(self):
+        brick_type = self.brick_type
+        return SCORE_VALUES[brick_type] if brick_type < len(SCORE_VALUES) else 50
+    
+    @property
+    def image(self):
+        return self.field.get_image(self.index)
     
     def hit(self):
         """
         Handle brick being hit.
-        Returns True if brick is destroyed, False otherwise.
+        Returns True if brick is destroyed, False otherwise (it shows cracked).
         """
-        self.health -= 1
-        
-        if self.health <= 0:
-            return True  # Destroyed
-        else:
-            # Show cracked version
-            self.image = self.assets.get_brick_sprite(self.brick_type, is_cracked=True)
-            return False
+        self.field.health[self.index] -= 1
+        return self.field.health[self.index] <= 0
     
     def get_particle_type(self):
         """Get the particle type for this brick."""
         return self.brick_type
 
 
-class Particle(pygame.sprite.Sprite):
+class Particle(PooledSprite):
     """Particle effect for brick destruction."""
     
-    def __init__(self, x, y, image):
+    def __init__(self, x, y, fade_frames, rng=random):
         super().__init__()
-        self.original_image = image
-        self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect = fade_frames[-1].get_rect()
+        self.pos = pygame.math.Vector2()
+        self.velocity = pygame.math.Vector2()
+        self.reset(x, y, fade_frames, rng)
+    
+    def reset(self, x, y, fade_frames, rng=random):
+        """(Re)initialise the particle; reuses its Rect and vectors when pooled."""
+        self.fade_frames = fade_frames  # Pre-faded images, transparent -> opaque
+        self.image = fade_frames[-1]
+        self.rect.size = self.image.get_size()
+        self.rect.center = (x, y)
+        self.pos.update(self.rect.topleft)
         
         # Random velocity
-        angle = random.uniform(0, 360)
-        speed = random.uniform(2, PARTICLE_SPEED)
-        self.velocity = pygame.math.Vector2(
+        angle = rng.uniform(0, 360)
+        speed = rng.uniform(2, PARTICLE_SPEED)
+        self.velocity.update(
             math.cos(math.radians(angle)) * speed,
             math.sin(math.radians(angle)) * speed
         )
@@ -270,34 +289,43 @@ class Particle(pygame.sprite.Sprite):
             self.kill()
             return
         
-        # Apply gravity
-        self.velocity.y += PARTICLE_GRAVITY
-        
-        # Move
-        self.rect.x += self.velocity.x
-        self.rect.y += self.velocity.y
+        # Apply gravity, then move (speeds are per MOVE_FRAME_MS)
+        scale = dt / MOVE_FRAME_MS
+        self.velocity.y += PARTICLE_GRAVITY * scale
+        self.pos += self.velocity * scale
+        self.rect.topleft = (round(self.pos.x), round(self.pos.y))
         
         # Fade out
         progress = self.age / self.lifetime
         self.alpha = int(255 * (1 - progress))
         
-        # Apply alpha
-        self.image = self.original_image.copy()
-        self.image.set_alpha(self.alpha)
+        # Look up the pre-faded frame
+        levels = len(self.fade_frames)
+        self.image = self.fade_frames[(self.alpha * (levels - 1) + 127) // 255]
 
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite):
     """Projectile for Super Bullet power-up."""
     
     def __init__(self, x, y, image):
         super().__init__()
+        self.rect = image.get_rect()
+        self.reset(x, y, image)
+    
+    def reset(self, x, y, image):
+        """(Re)initialise the bullet; reuses its Rect when pooled."""
         self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect.size = image.get_size()
+        self.rect.center = (x, y)
+        self.prev_topleft = self.rect.topleft
+        self.y = float(self.rect.y)
         self.speed = BULLET_SPEED
     
-    def update(self, dt=0):
+    def update(self, dt=MOVE_FRAME_MS):
         """Move bullet upward."""
-        self.rect.y -= self.speed
+        self.prev_topleft = self.rect.topleft
+        self.y -= self.speed * dt / MOVE_FRAME_MS
+        self.rect.y = round(self.y)
         
         # Remove if off screen
         if self.rect.bottom < 0:
@@ -0,0 +1,209 @@
+"""
+Per-frame profiler for Breakout.
+Records timed spans around the stages of every frame (events, each part
+of the update, each draw layer, the flip) into a fixed-size ring buffer,
+exports them as a Chrome trace (chrome://tracing or ui.perfetto.dev) and
+draws an on-screen frame-time graph.
+"""
+
+from array import array
+import json
+import time
+import pygame
+from config import FRAME_PROFILE_SPANS, FRAME_GRAPH_FRAMES, FRAME_GRAPH_SIZE, FPS
+
+TRACE_PID = 1
+TRACE_TID = 1
+
+
+class _Span:
+    """Reusable context manager for one span name."""
+    
+    __slots__ = ("profiler", "name_id", "start")
+    
+    def __init__(self, profiler, name_id):
+        self.profiler = profiler
+        self.name_id = name_id
+        self.start = 0
+    
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+    
+    def __exit__(self, *exc):
+        self.profiler._record(self.name_id, self.start, time.perf_counter_ns())
+
+
+class _FrameSpan(_Span):
+    """Span around a whole frame; also feeds the frame-time graph."""
+    
+    __slots__ = ()
+    
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        profiler = self.profiler
+        profiler._record(self.name_id, self.start, end)
+        profiler.frame_times[profiler.frame_count % len(profiler.frame_times)] = (end - self.start) / 1e6
+        profiler.frame_count += 1
+
+
+class FrameProfiler:
+    """Ring buffer of (name, start, end) spans.
+    
+    Storage is allocated up front: span names are interned to small
+    ids, and ids and nanosecond timestamps go into typed arrays, so
+    recording a span allocates nothing. Once capacity spans have been
+    recorded the oldest are overwritten. span() hands out one reusable
+    context manager per name; spans with different names may nest.
+    """
+    
+    enabled = True
+    
+    def __init__(self, capacity=FRAME_PROFILE_SPANS, graph_frames=FRAME_GRAPH_FRAMES):
+        self.capacity = capacity
+        self.names = []      # name id -> name
+        self._spans = {}     # name -> _Span
+        self.name_ids = array("H", [0]) * capacity
+        self.starts = array("q", [0]) * capacity
+        self.ends = array("q", [0]) * capacity
+        self.count = 0       # Spans recorded so far (including overwritten ones)
+        
+        self.frame_times = array("d", [0.0]) * graph_frames  # Milliseconds, ring
+        self.frame_count = 0
+        self._frame = _FrameSpan(self, self._intern("frame"))
+        self.origin = time.perf_counter_ns()
+    
+    def _intern(self, name):
+        self.names.append(name)
+        return len(self.names) - 1
+    
+    def span(self, name):
+        """Get the context manager that times a span called name."""
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, self._intern(name))
+        return span
+    
+    def frame(self):
+        """Get the context manager that times a whole frame."""
+        return self._frame
+    
+    def _record(self, name_id, start, end):
+        i = self.count % self.capacity
+        self.name_ids[i] = name_id
+        self.starts[i] = start
+        self.ends[i] = end
+        self.count += 1
+    
+    def spans(self):
+        """Yield the buffered spans oldest first as (name, start_ns, end_ns)."""
+        first = max(0, self.count - self.capacity)
+        for n in range(first, self.count):
+            i = n % self.capacity
+            yield self.names[self.name_ids[i]], self.starts[i], self.ends[i]
+    
+    def recent_frame_times(self):
+        """Get the last frame times in milliseconds, oldest first."""
+        size = len(self.frame_times)
+        if self.frame_count < size:
+            return self.frame_times[:self.frame_count].tolist()
+        split = self.frame_count % size
+        return (self.frame_times[split:] + self.frame_times[:split]).tolist()
+    
+    def stats(self):
+        """Get {name: (count, mean_ms, max_ms)} over the buffered spans."""
+        totals = {}
+        for name, start, end in self.spans():
+            count, total, longest = totals.get(name, (0, 0, 0))
+            duration = end - start
+            totals[name] = (count + 1, total + duration, max(longest, duration))
+        return {
+            name: (count, total / count / 1e6, longest / 1e6)
+            for name, (count, total, longest) in totals.items()
+        }
+    
+    def chrome_trace(self):
+        """Build a Chrome trace event dict of the buffered spans."""
+        events = [
+            {"name": "process_name", "ph": "M", "pid": TRACE_PID, "args": {"name": "Breakout"}},
+            {"name": "thread_name", "ph": "M", "pid": TRACE_PID, "tid": TRACE_TID, "args": {"name": "game loop"}},
+        ]
+        for name, start, end in self.spans():
+            events.append({
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,  # Microseconds
+                "dur": (end - start) / 1000,
+                "pid": TRACE_PID,
+                "tid": TRACE_TID,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    
+    def write_chrome_trace(self, path):
+        """Write the buffered spans as a Chrome trace JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+class _NullSpan:
+    __slots__ = ()
+    
+    def __enter__(self):
+        pass
+    
+    def __exit__(self, *exc):
+        pass
+
+
+class NullFrameProfiler:
+    """Profiler that records nothing; the default when profiling is off.
+    
+    Every span is one shared no-op context manager, so frame stages are
+    wrapped the same way whether or not profiling is on.
+    """
+    
+    enabled = False
+    _span = _NullSpan()
+    
+    def span(self, name):
+        return self._span
+    
+    def frame(self):
+        return self._span
+
+
+NULL_FRAME_PROFILER = NullFrameProfiler()
+
+
+class FrameGraph:
+    """On-screen bar graph of recent frame times against the frame budget.
+    
+    Bars are green within the budget and red over it; the line marks
+    the budget and the top of the graph is twice the budget.
+    """
+    
+    def __init__(self, size=FRAME_GRAPH_SIZE, budget_ms=1000 / FPS):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.budget_ms = budget_ms
+    
+    def draw(self, screen, profiler, topright):
+        """Draw the graph with its top-right corner at topright. Returns the rect drawn."""
+        surface = self.surface
+        width, height = surface.get_size()
+        surface.fill((0, 0, 0, 160))
+        
+        times = profiler.recent_frame_times()
+        scale = height / (self.budget_ms * 2)
+        bar = width / len(profiler.frame_times)
+        x = width - bar * len(times)
+        for ms in times:
+            bar_height = min(height, max(1, round(ms * scale)))
+            color = (80, 220, 120) if ms <= self.budget_ms else (240, 70, 70)
+            surface.fill(color, (round(x), height - bar_height, max(1, round(bar)), bar_height))
+            x += bar
+        
+        budget_y = height - round(self.budget_ms * scale)
+        pygame.draw.line(surface, (255, 255, 255), (0, budget_y), (width, budget_y))
+        
+        rect = surface.get_rect(topright=topright)
+        return screen.blit(surface, rect)
@@ -0,0 +1,93 @@
+"""
+Headless simulation mode for Breakout.
+Runs the full update loop without a window, rendering or frame cap,
+driving the paddle from an input script instead of the mouse.
+
+Usage:
+    python headless.py --ticks 100000 --level 1
+"""
+
+import argparse
+import time
+from config import (
+    SIM_STEP, STATE_PLAYING, STATE_LEVEL_COMPLETE, STATE_GAME_OVER, STATE_WIN, LEVEL_PACK_PATH, ENDLESS_SEED
+)
+from controls import TrackingInput
+from main import Game
+
+
+class HeadlessGame(Game):
+    """Game that steps the simulation with a fixed dt and never draws."""
+    
+    def __init__(self, input_source=None, dt=SIM_STEP, auto_advance=True, level_pack=LEVEL_PACK_PATH,
+                 endless_seed=ENDLESS_SEED, trace_path=None):
+        super().__init__(headless=True, input_source=input_source or TrackingInput(),
+                         level_pack=level_pack, endless_seed=endless_seed, trace_path=trace_path)
+        self.dt = self.sim_step = dt  # sim_step goes into recordings
+        self.auto_advance = auto_advance  # Continue to the next level on completion
+        self.ticks = 0
+    
+    def step(self, ticks=1):
+        """Advance the simulation by a number of fixed ticks."""
+        prof = self.frame_profiler
+        for _ in range(ticks):
+            with prof.frame():
+                self._step(self.dt)
+            self.ticks += 1
+            
+            if self.state == STATE_LEVEL_COMPLETE and self.auto_advance:
+                self.advance_level()
+    
+    def run(self, max_ticks):
+        """Step until the game ends or max_ticks is reached. Returns ticks run."""
+        start = self.ticks
+        while self.ticks - start < max_ticks and self.state == STATE_PLAYING:
+            self.step()
+        return self.ticks - start
+    
+    def is_finished(self):
+        """Check if the game has ended (won or lost)."""
+        return self.state in (STATE_GAME_OVER, STATE_WIN)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run Breakout without a window.")
+    parser.add_argument("--ticks", type=int, default=3600, help="maximum ticks to simulate")
+    parser.add_argument("--dt", type=float, default=SIM_STEP, help="tick length in milliseconds")
+    parser.add_argument("--level", type=int, default=1, help="starting level (1-indexed)")
+    parser.add_argument("--seed", type=int, help="game seed (default: random)")
+    parser.add_argument("--balls", type=int, default=0, help="extra balls to release at the start")
+    parser.add_argument("--pack", default=LEVEL_PACK_PATH, help="level pack file to play")
+    parser.add_argument("--endless", type=int, default=ENDLESS_SEED, metavar="SEED",
+                        help="keep going with procedural levels generated from SEED")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="profile every tick and write a Chrome trace to PATH")
+    args = parser.parse_args()
+    
+    game = HeadlessGame(dt=args.dt, level_pack=args.pack, endless_seed=args.endless,
+                        trace_path=args.trace)
+    game.new_game(seed=args.seed, level=args.level - 1)
+    if args.balls:
+        game.spawn_balls(args.balls)
+    
+    start = time.perf_counter()
+    ticks = game.run(args.ticks)
+    elapsed = time.perf_counter() - start
+    
+    print(f"Simulated {ticks} ticks ({ticks * game.dt / 1000:.1f}s game time) "
+          f"in {elapsed:.2f}s: {ticks / max(elapsed, 1e-9):.0f} ticks/s")
+    print(f"State: {game.state}  Level: {game.level_manager.get_current_level_num()}  "
+          f"Score: {game.score}  Lives: {game.lives}")
+    for name, stats in game.pool_stats().items():
+        print(f"Pool {name}: {stats['hit_rate']:.0%} reused, "
+              f"high water {stats['high_water']}, {stats['free']} free")
+    
+    if args.trace:
+        game.frame_profiler.write_chrome_trace(args.trace)
+        for name, (count, mean, longest) in sorted(game.frame_profiler.stats().items()):
+            print(f"{name:<18} {count:>7} spans  mean {mean:.3f}ms  max {longest:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Level pack files for Breakout.
+A pack holds any number of levels of any size in one binary file with
+an index up front, so a level can be found by number and decoded on its
+own from a memory map without reading the rest of the file.
+
+Layout (little-endian):
+    header  magic b"BKLP", u16 version, u16 reserved, u32 level count
+    index   per level: u64 data offset, u16 cols, u16 rows
+    data    per level: cols * rows signed bytes, row-major brick types
+            0 to BRICK_TYPES - 1, or -1 for an empty cell
+
+Levels of any size up to what fits on screen at BRICK_MIN_SIZE bricks
+are accepted; bricks are shrunk to fit (see bricks.field_layout).
+Levels that cannot be played (too large, or invalid brick types) are
+recorded in LevelPack.bad_levels and skipped by the game.
+
+Usage:
+    python levelpack.py build levels.bklp
+    python levelpack.py info levels.bklp
+"""
+
+import argparse
+import mmap
+import struct
+from bricks import field_layout
+from config import BRICK_TYPES
+
+MAGIC = b"BKLP"
+PACK_FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+INDEX_ENTRY = struct.Struct("<QHH")
+
+# Cell bytes that are valid brick types (-1 is stored as 0xFF)
+_VALID_CELLS = bytes(range(BRICK_TYPES)) + b"\xff"
+
+
+class LevelPackError(ValueError):
+    """Raised for files that are not valid level packs."""
+
+
+class LevelPack:
+    """Read-only, memory-mapped level pack.
+    
+    Opening a pack reads only the header and index. get_level() copies
+    out just the bytes of the requested level, so the OS pages in that
+    level alone and the pack never has to fit in RAM.
+    
+    A bad level does not reject the pack: bad_levels maps its number to
+    the reason, found when reading the index (too large to fit on
+    screen) or when the level is first decoded (invalid brick types).
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise LevelPackError(f"{path}: empty file")
+        
+        try:
+            self._read_index()
+        except (LevelPackError, struct.error) as e:
+            self.close()
+            raise LevelPackError(f"{path}: {e}")
+    
+    def _read_index(self):
+        """Parse the header, check every index entry lies inside the file and record levels too large to play."""
+        magic, version, _, count = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise LevelPackError("not a level pack")
+        if version != PACK_FORMAT_VERSION:
+            raise LevelPackError(f"unsupported version {version}")
+        
+        self.index = []  # (offset, cols, rows) per level
+        self.bad_levels = {}  # level -> why it cannot be played
+        for i in range(count):
+            offset, cols, rows = INDEX_ENTRY.unpack_from(self.buffer, HEADER.size + i * INDEX_ENTRY.size)
+            if offset + cols * rows > len(self.buffer):
+                raise LevelPackError(f"level {i} is truncated")
+            if field_layout(cols, rows) is None:
+                self.bad_levels[i] = f"is too large to fit on screen ({cols}x{rows})"
+            self.index.append((offset, cols, rows))
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def get_size(self, level):
+        """Get (cols, rows) of a level (0-indexed)."""
+        _, cols, rows = self.index[level]
+        return cols, rows
+    
+    def get_level(self, level):
+        """
+        Decode one level (0-indexed). Returns (cols, rows, cells).
+        Raises LevelPackError for a level in bad_levels, or one with a
+        cell that is not a valid brick type (which is then added to it).
+        """
+        reason = self.bad_levels.get(level)
+        if reason is None:
+            offset, cols, rows = self.index[level]
+            cells = self.buffer[offset:offset + cols * rows]
+            if check_cells(cells):
+                return cols, rows, cells
+            reason = self.bad_levels[level] = "has invalid brick types"
+        raise LevelPackError(f"{self.path}: level {level} {reason}")
+    
+    def close(self):
+        """Unmap and close the file."""
+        self.buffer.close()
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def check_cells(cells):
+    """Check that every cell byte is a brick type or empty."""
+    return not bytes(cells).translate(None, _VALID_CELLS)
+
+
+def encode_pattern(pattern):
+    """Flatten rows of brick types into (cols, rows, cells); short rows are padded with empties."""
+    cols = max((len(row) for row in pattern), default=0)
+    cells = bytearray(b"\xff" * (cols * len(pattern)))
+    for row_idx, row in enumerate(pattern):
+        base = row_idx * cols
+        cells[base:base + len(row)] = struct.pack(f"{len(row)}b", *(max(t, -1) for t in row))
+    return cols, len(pattern), bytes(cells)
+
+
+def write_pack(path, levels):
+    """
+    Write a level pack. Each level is either a pattern (rows of brick
+    types) or a (cols, rows, cells) tuple as returned by get_level().
+    Raises LevelPackError for levels the game could not load.
+    """
+    encoded = [level if isinstance(level, tuple) else encode_pattern(level) for level in levels]
+    for i, (cols, rows, cells) in enumerate(encoded):
+        if len(cells) != cols * rows:
+            raise LevelPackError(f"level {i}: {len(cells)} cells for a {cols}x{rows} grid")
+        if field_layout(cols, rows) is None:
+            raise LevelPackError(f"level {i} is too large to fit on screen ({cols}x{rows})")
+        if not check_cells(cells):
+            raise LevelPackError(f"level {i} has invalid brick types")
+    
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, PACK_FORMAT_VERSION, 0, len(encoded)))
+        offset = HEADER.size + INDEX_ENTRY.size * len(encoded)
+        for cols, rows, cells in encoded:
+            f.write(INDEX_ENTRY.pack(offset, cols, rows))
+            offset += len(cells)
+        for _, _, cells in encoded:
+            f.write(cells)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build or inspect Breakout level packs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="write the built-in levels to a pack")
+    build.add_argument("path")
+    info = commands.add_parser("info", help="list the levels in a pack")
+    info.add_argument("path")
+    args = parser.parse_args()
+    
+    if args.command == "build":
+        from levels import LEVEL_PATTERNS
+        write_pack(args.path, LEVEL_PATTERNS)
+        print(f"Wrote {len(LEVEL_PATTERNS)} levels to {args.path}")
+    else:
+        with LevelPack(args.path) as pack:
+            print(f"{args.path}: {len(pack)} levels")
+            for i in range(len(pack)):
+                cols, rows = pack.get_size(i)
+                bad = pack.bad_levels.get(i)
+                print(f"{i + 1:>5}  {cols}x{rows}" + (f"  (bad: {bad})" if bad else ""))
+
+
+if __name__ == "__main__":
+    main()
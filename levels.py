@@ -2,10 +2,9 @@
 Level definitions for Breakout game.
 """
 
-from config import (
-    BRICK_COLS, BRICK_ROWS, BRICK_WIDTH, BRICK_HEIGHT,
-    BRICK_PADDING, BRICK_TOP_OFFSET, BRICK_LEFT_OFFSET
-)
+from bricks import BrickField, field_layout
+from levelpack import LevelPack, LevelPackError
+from procgen import ProceduralLevels
 
 
 # Level patterns - each number represents a brick type (0-9), -1 means empty
@@ -64,46 +63,76 @@ LEVEL_PATTERNS = [
 
 
 class LevelManager:
-    """Manages level loading and progression."""
+    """Manages level loading and progression.
     
-    def __init__(self, assets):
+    Plays the built-in LEVEL_PATTERNS, or the levels of a level pack
+    file when pack_path is given. Packs are memory-mapped and each level
+    is decoded only when it is played; levels larger than the standard
+    grid get smaller bricks so they fit on screen, and levels the pack
+    reports as bad are skipped with a message. With an endless_seed, play
+    continues past the last level with procedural levels, generated
+    ahead of time in the background.
+    """
+    
+    def __init__(self, assets, pack_path=None, endless_seed=None):
         self.assets = assets
         self.current_level = 0
-        self.total_levels = len(LEVEL_PATTERNS)
+        self.pack = None
+        if pack_path:
+            try:
+                self.pack = LevelPack(pack_path)
+            except (OSError, LevelPackError) as e:
+                print(f"Error loading level pack: {e}")
+        self.total_levels = len(self.pack) if self.pack else len(LEVEL_PATTERNS)
+        self.endless = ProceduralLevels(endless_seed) if endless_seed is not None else None
     
-    def get_level_bricks(self, level_num=None):
+    def get_level_field(self, level_num=None):
         """
-        Generate bricks for a level.
-        Returns a list of Brick objects.
+        Build the bricks for a level.
+        Returns a BrickField (empty once every level has been played).
         """
-        from entities import Brick
-        
         if level_num is not None:
             self.current_level = level_num
         
-        if self.current_level >= self.total_levels:
-            return []  # No more levels
+        level = self._next_pack_level() if self.pack else None
+        
+        if self.endless:
+            # Have the worker start on the levels after this one
+            self.endless.prefetch(max(self.current_level + 1, self.total_levels))
         
-        pattern = LEVEL_PATTERNS[self.current_level]
-        bricks = []
+        if level is not None:
+            # Only levels that fit get past the pack (see LevelPack.bad_levels)
+            cols, rows, cells = level
+            return BrickField.from_cells(cols, rows, cells, self.assets, **field_layout(cols, rows))
         
-        for row_idx, row in enumerate(pattern):
-            for col_idx, brick_type in enumerate(row):
-                if brick_type < 0:  # -1 means empty space
-                    continue
-                
-                x = BRICK_LEFT_OFFSET + col_idx * (BRICK_WIDTH + BRICK_PADDING)
-                y = BRICK_TOP_OFFSET + row_idx * (BRICK_HEIGHT + BRICK_PADDING)
-                
-                brick = Brick(x, y, brick_type, self.assets)
-                bricks.append(brick)
+        if self.current_level >= self.total_levels:
+            if self.endless:
+                cols, rows, cells = self.endless.get(self.current_level)
+                return BrickField.from_cells(cols, rows, cells, self.assets, **field_layout(cols, rows))
+            return BrickField(0, 0, self.assets)  # No more levels
         
-        return bricks
+        return BrickField.from_pattern(LEVEL_PATTERNS[self.current_level], self.assets)
+    
+    def _next_pack_level(self):
+        """
+        Decode the current pack level, first moving past any that cannot
+        be played (logging each). Returns (cols, rows, cells), or None
+        once past the last level of the pack.
+        """
+        while self.current_level < self.total_levels:
+            try:
+                return self.pack.get_level(self.current_level)
+            except LevelPackError as e:
+                print(f"Skipping level {self.current_level + 1}: {e}")
+                self.current_level += 1
+        return None
     
     def next_level(self):
-        """Advance to next level. Returns True if successful, False if no more levels."""
+        """Advance to next playable level. Returns True if successful, False if no more levels."""
         self.current_level += 1
-        return self.current_level < self.total_levels
+        if self.pack:
+            self._next_pack_level()
+        return self.endless is not None or self.current_level < self.total_levels
     
     def reset(self):
         """Reset to first level."""
@@ -115,4 +144,4 @@ class LevelManager:
     
     def is_final_level(self):
         """Check if this is the final level."""
-        return self.current_level >= self.total_levels - 1
+        return self.endless is None and self.current_level >= self.total_levels - 1
@@ -3,57 +3,100 @@ Breakout Game - Main Entry Point
 A fully-featured Brick Breaker game with power-ups and particle effects.
 """
 
+import argparse
+import os
 import pygame
 import sys
 from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_FPS, TITLE, SIM_STEP, MOVE_FRAME_MS, MAX_FRAME_TIME,
     BLACK, WHITE, DARK_GRAY, NEON_BLUE, NEON_PINK,
     PADDLE_Y, INITIAL_LIVES, HEART_SPACING, HEART_Y, HEART_SIZE,
     PARTICLE_COUNT, BULLET_COOLDOWN,
     STATE_MENU, STATE_PLAYING, STATE_PAUSED, STATE_GAME_OVER,
     STATE_LEVEL_COMPLETE, STATE_WIN,
-    POWERUP_SLOW, POWERUP_FAST, POWERUP_BULLET
+    POWERUP_SLOW, POWERUP_FAST, POWERUP_BULLET, POWERUP_MULTIBALL,
+    MULTIBALL_SPLIT, MULTIBALL_STRESS_COUNT,
+    RENDER_MODE, RENDER_MODE_FULL, RENDER_MODE_DIRTY, LEVEL_PACK_PATH, ENDLESS_SEED
 )
 from assets import AssetManager
-from entities import Ball, Paddle, Particle, Bullet
-from powerups import PowerUpManager
+from controls import MouseInput
+from entities import Ball, Paddle, Bullet, interpolate_topleft
+from particles import create_particle_system
+from multiball import BallArray
+from powerups import PowerUp, PowerUpManager
 from levels import LevelManager
+from bricks import BrickField
+from collision import sweep_ball, CONTACT_BRICK, CONTACT_PADDLE
+from render import DirtyRectRenderer, BrickLayer
+from text_cache import TextCache
+from pool import ObjectPool, kill_all
+from backgrounds import BackgroundCache, DEFAULT_THEME, LEVEL_THEMES, theme_for_level
+from startup_profile import NULL_PROFILER
+from rng import RandomStreams
+from recording import InputRecorder, numbered_path
+from frame_profile import FrameProfiler, FrameGraph, NULL_FRAME_PROFILER
+from telemetry import Telemetry
 
 
 class Game:
     """Main game class."""
     
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-        
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(TITLE)
+    def __init__(self, headless=False, input_source=None, profiler=NULL_PROFILER,
+                 level_pack=LEVEL_PACK_PATH, endless_seed=ENDLESS_SEED, record_path=None,
+                 trace_path=None, telemetry_path=None):
+        self.headless = headless
+        if headless:
+            # No window or sound card: SDL still needs a video mode for convert_alpha()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        
+        with profiler.section("pygame.init"):
+            pygame.init()
+        if not headless:
+            with profiler.section("pygame.mixer.init"):
+                pygame.mixer.init()
+        
+        with profiler.section("display.set_mode"):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption(TITLE)
         
         self.clock = pygame.time.Clock()
+        self.sim_time = 0  # Milliseconds of gameplay simulated; stops while paused
+        self.sim_step = SIM_STEP  # Milliseconds per tick of run()
+        self.rng = RandomStreams()  # Reseeded by every new_game()
         self.running = True
         self.fullscreen = False
         
-        # Load assets
-        self.assets = AssetManager()
+        # Load assets: the menu needs none, so stream them in while it is shown
+        with profiler.section("AssetManager"):
+            self.assets = AssetManager(
+                load_audio=not headless, background=not headless, profiler=profiler
+            )
         
         # Start background music
         if self.assets.bg_music:
-            try:
-                pygame.mixer.music.load(self.assets.bg_music)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-                pygame.mixer.music.set_volume(0.5)  # Set volume to 50%
-            except pygame.error as e:
-                print(f"Error playing music: {e}")
+            with profiler.section("music"):
+                try:
+                    pygame.mixer.music.load(self.assets.bg_music)
+                    pygame.mixer.music.play(-1)  # Loop indefinitely
+                    pygame.mixer.music.set_volume(0.5)  # Set volume to 50%
+                except pygame.error as e:
+                    print(f"Error playing music: {e}")
         
         # Initialize managers
-        self.level_manager = LevelManager(self.assets)
-        self.powerup_manager = PowerUpManager()
+        self.level_manager = LevelManager(self.assets, level_pack, endless_seed)
+        # Multi-ball only drops when extra balls are supported (they need NumPy)
+        powerup_types = [
+            ptype for ptype in PowerUp.TYPES if ptype != POWERUP_MULTIBALL or BallArray.enabled
+        ]
+        self.powerup_manager = PowerUpManager(self.rng.powerups, powerup_types)
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        with profiler.section("fonts"):
+            self.font_large = pygame.font.Font(None, 72)
+            self.font_medium = pygame.font.Font(None, 48)
+            self.font_small = pygame.font.Font(None, 36)
+        self.text_cache = TextCache()
         
         # Game state
         self.state = STATE_MENU
@@ -63,33 +106,62 @@ class Game:
         
         # Sprite groups
         self.all_sprites = pygame.sprite.Group()
-        self.bricks = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
+        self.particles = create_particle_system(self.assets)
         self.bullets = pygame.sprite.Group()
+        self.bullet_pool = ObjectPool(Bullet)
+        
+        # The current level's bricks; also the spatial index for collision queries
+        self.brick_field = BrickField(0, 0, self.assets)
         
         # Game objects
         self.paddle = None
         self.ball = None
+        self.extra_balls = BallArray()  # Multi-ball power-up and stress mode
         
         # Bullet timing
         self.last_bullet_time = 0
         
-        # Background
-        self.bg_surface = self._create_background()
-    
-    def _create_background(self):
-        """Create a gradient background."""
-        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            # Gradient from dark top to slightly lighter bottom
-            ratio = y / SCREEN_HEIGHT
-            color = (
-                int(20 + 15 * ratio),
-                int(20 + 15 * ratio),
-                int(35 + 20 * ratio)
-            )
-            pygame.draw.line(surface, color, (0, y), (SCREEN_WIDTH, y))
-        return surface
+        # Input
+        self.input_source = input_source or MouseInput()
+        self.launch_requested = False
+        self.stress_requested = False
+        
+        # Per-tick input is written here when recording (see recording.py)
+        self.record_path = record_path
+        self.recorder = None
+        
+        # Per-frame profiling: on when writing a trace or showing the frame graph (F3)
+        self.trace_path = trace_path
+        self.frame_profiler = FrameProfiler() if trace_path else NULL_FRAME_PROFILER
+        self.frame_graph = None  # FrameGraph while shown
+        
+        # Frame-time telemetry log, for unattended sessions
+        self.telemetry = Telemetry(telemetry_path) if telemetry_path else None
+        
+        # Background (menu theme; each level swaps in its own)
+        self.backgrounds = BackgroundCache()
+        with profiler.section("_create_background"):
+            self.bg_surface = self._create_background()
+        # Level themes are generated in the background, ready before the first level change
+        self.backgrounds.prefetch(LEVEL_THEMES, self.screen.get_size())
+        
+        # Background with the current level's bricks composited on top
+        self.brick_layer = BrickLayer(self.bg_surface)
+        
+        # Rendering
+        self.render_mode = RENDER_MODE
+        self.dirty_renderer = DirtyRectRenderer()
+        self._presented_dirty = False  # Last frame was drawn by the dirty-rect path
+        self._frame_changed = True     # Last _draw changed the screen and must be presented
+        
+        # Idle screens are drawn once and kept on screen until their content changes
+        self.frozen_key = None
+        self.overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay_surface.fill((0, 0, 0, 180))
+    
+    def _create_background(self, theme=DEFAULT_THEME):
+        """Get the gradient background for a theme at the current resolution."""
+        return self.backgrounds.get(theme, self.screen.get_size())
     
     def _toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
@@ -98,26 +170,81 @@ class Game:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
         else:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.dirty_renderer.invalidate_all()
+        self.frozen_key = None
+    
+    def _toggle_frame_graph(self):
+        """Show or hide the frame-time graph, profiling only while it is needed."""
+        if self.frame_graph:
+            self.frame_graph = None
+            if not self.trace_path:
+                self.frame_profiler = NULL_FRAME_PROFILER
+        else:
+            if not self.frame_profiler.enabled:
+                self.frame_profiler = FrameProfiler()
+            self.frame_graph = FrameGraph()
+        self.dirty_renderer.invalidate_all()
+    
+    def _toggle_render_mode(self):
+        """Switch between full-screen and dirty-rect rendering."""
+        if self.render_mode == RENDER_MODE_FULL:
+            self.render_mode = RENDER_MODE_DIRTY
+        else:
+            self.render_mode = RENDER_MODE_FULL
+        self.dirty_renderer.invalidate_all()
 
     
-    def new_game(self):
-        """Start a new game."""
+    def new_game(self, seed=None, level=0):
+        """
+        Start a new game from a 0-indexed level. The same seed and inputs
+        always play out the same way; a fresh seed is drawn if none is given.
+        """
+        try:
+            self.assets.wait_until_ready()
+        except RuntimeError:
+            return  # Loading failed: stay on the menu, which shows the error
+        self.rng.reseed(seed)
+        self.particles.reseed(self.rng.derive("particles"))
+        self.sim_time = 0
+        self.last_bullet_time = 0
         self.score = 0
         self.lives = INITIAL_LIVES
         self.combo = 0
         self.level_manager.reset()
+        self.level_manager.current_level = level
         self.powerup_manager.clear()
         self._setup_level()
         self.state = STATE_PLAYING
+        
+        if self.record_path:
+            self.stop_recording()
+            endless = self.level_manager.endless
+            path = numbered_path(self.record_path)
+            try:
+                self.recorder = InputRecorder(
+                    path, self.rng.seed, level, endless.seed if endless else None, self.sim_step
+                )
+                print(f"Recording to {path}")
+            except OSError as e:
+                print(f"Error starting recording: {e}")
+    
+    def stop_recording(self):
+        """Finish the current recording, if any."""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
     
     def _setup_level(self):
         """Set up the current level."""
         # Clear existing sprites
         self.all_sprites.empty()
-        self.bricks.empty()
-        self.particles.empty()
-        self.bullets.empty()
+        self.particles.clear()
+        kill_all(self.bullets)
         self.powerup_manager.clear()
+        self.extra_balls.clear()
+        
+        self.launch_requested = False
+        self.stress_requested = False
         
         # Create paddle
         self.paddle = Paddle(SCREEN_WIDTH // 2, PADDLE_Y, self.assets)
@@ -127,28 +254,55 @@ class Game:
         self.ball = Ball(
             SCREEN_WIDTH // 2,
             PADDLE_Y - 30,
-            self.assets.ball
+            self.assets.ball,
+            self.rng.ball
         )
         self.all_sprites.add(self.ball)
         
         # Load bricks for current level
-        bricks = self.level_manager.get_level_bricks()
-        for brick in bricks:
-            self.bricks.add(brick)
-            self.all_sprites.add(brick)
+        self.set_brick_field(self.level_manager.get_level_field())
+    
+    def set_brick_field(self, field):
+        """Replace the current level's bricks with a BrickField."""
+        self.brick_field = field
+        self.extra_balls.set_bricks(field)
+        theme = theme_for_level(self.level_manager.current_level)
+        self.brick_layer.rebuild(field.draw_items(), background=self._create_background(theme))
+        self.dirty_renderer.invalidate_all()
     
     def run(self):
-        """Main game loop."""
+        """
+        Main game loop.
+        The simulation advances in fixed sim_step ticks fed by an accumulator
+        of real frame time; rendering interpolates between the last two ticks.
+        """
+        accumulator = 0
+        step = self.sim_step
         while self.running:
-            dt = self.clock.tick(FPS)
-            current_time = pygame.time.get_ticks()
+            frame_time = self.clock.tick(FPS if self.state == STATE_PLAYING else IDLE_FPS)
+            accumulator += min(frame_time, MAX_FRAME_TIME)
             
-            self._handle_events()
-            self._update(dt, current_time)
-            self._draw()
+            prof = self.frame_profiler
+            with prof.frame():
+                with prof.span("events"):
+                    self._handle_events()
+                while accumulator >= step:
+                    with prof.span("update"):
+                        self._step(step)
+                    accumulator -= step
+                with prof.span("draw"):
+                    self._draw(accumulator / step)
+                with prof.span("flip"):
+                    self._present()
             
-            pygame.display.flip()
-        
+            if self.telemetry:
+                self.telemetry.record_frame(self, frame_time)
+        
+        self.stop_recording()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.trace_path:
+            self.frame_profiler.write_chrome_trace(self.trace_path)
         pygame.quit()
         sys.exit()
     
@@ -158,6 +312,9 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.frozen_key = None  # Window contents lost: repaint idle screens
+            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.state == STATE_PLAYING:
@@ -171,41 +328,99 @@ class Game:
                     if self.state == STATE_MENU:
                         self.new_game()
                     elif self.state == STATE_PLAYING and not self.ball.active:
-                        self.ball.launch()
+                        self.launch_requested = True
                     elif self.state == STATE_PAUSED:
                         self.state = STATE_PLAYING
                     elif self.state == STATE_LEVEL_COMPLETE:
-                        if self.level_manager.next_level():
-                            self._setup_level()
-                            self.state = STATE_PLAYING
-                        else:
-                            self.state = STATE_WIN
+                        self.advance_level()
                     elif self.state in (STATE_GAME_OVER, STATE_WIN):
                         self.new_game()
                 
                 elif event.key == pygame.K_r and self.state in (STATE_GAME_OVER, STATE_WIN):
                     self.new_game()
                 
-                elif event.key == pygame.K_f:
+                elif event.key == pygame.K_f and not self.assets.is_loading():
+                    # Not while the loader converts sprites for the current display mode
                     self._toggle_fullscreen()
+                
+                elif event.key == pygame.K_F3:
+                    self._toggle_frame_graph()
+                
+                elif event.key == pygame.K_F4:
+                    self._toggle_render_mode()
+                
+                elif event.key == pygame.K_F5 and self.state == STATE_PLAYING:
+                    self.stress_requested = True  # Handled in _update so recordings capture it
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     if self.state == STATE_MENU:
                         self.new_game()
                     elif self.state == STATE_PLAYING and not self.ball.active:
-                        self.ball.launch()
+                        self.launch_requested = True
+    
+    def advance_level(self):
+        """Move on from a completed level, or to the win screen after the last one."""
+        if self.level_manager.next_level():
+            self._setup_level()
+            self.state = STATE_PLAYING
+        else:
+            self.state = STATE_WIN
+    
+    def _step(self, dt):
+        """Advance the simulation by one tick of dt milliseconds."""
+        if self.state == STATE_PLAYING:
+            self.sim_time += dt
+        self._update(dt, self.sim_time)
     
     def _update(self, dt, current_time):
         """Update game state."""
         if self.state != STATE_PLAYING:
             return
         
+        prof = self.frame_profiler
+        with prof.span("update.paddle"):
+            inputs = self._update_paddle(dt)
+        # Brick hits are timed separately (update.bricks, nested in update.ball)
+        with prof.span("update.ball"):
+            self._update_ball(dt, inputs)
+        with prof.span("update.powerups"):
+            self._update_powerups(dt, current_time)
+        with prof.span("update.particles"):
+            self.particles.update(dt)
+        with prof.span("update.bullets"):
+            self._update_bullets(dt, current_time, inputs)
+        
+        # Check level complete
+        if self.brick_field.is_clear():
+            self.state = STATE_LEVEL_COMPLETE
+    
+    def _update_paddle(self, dt):
+        """Read this tick's input and move the paddle. Returns the InputState."""
+        inputs = self.input_source.poll(self)
+        if self.launch_requested:
+            inputs.launch = True
+            self.launch_requested = False
+        if self.stress_requested:
+            inputs.stress = True
+            self.stress_requested = False
+        if self.recorder is not None:
+            self.recorder.record(inputs)
+        
         # Update paddle
-        self.paddle.update(dt)
+        self.paddle.update(dt, inputs.target_x)
+        return inputs
+    
+    def _update_ball(self, dt, inputs):
+        """Launch and move the balls, losing a life when the last one falls out."""
+        # Launch ball
+        if inputs.launch and not self.ball.active:
+            self.ball.launch()
+        if inputs.stress:
+            self.spawn_balls(MULTIBALL_STRESS_COUNT)
         
         # Update ball
-        self.ball.update(self.paddle.rect, self.assets.thud_sound)
+        self.ball.update(self.paddle.rect)
         
         # Handle power-up speed effects on ball
         active_powerup = self.powerup_manager.get_active_type()
@@ -219,16 +434,22 @@ class Game:
         # Update paddle power-up display
         self.paddle.active_powerup = active_powerup
         
-        # Ball-paddle collision
-        if self.ball.collide_paddle(self.paddle.rect):
-            if self.assets.thud_sound:
-                self.assets.thud_sound.play()
-            self.combo = 0  # Reset combo on paddle hit
+        # Move ball, bouncing off walls, paddle and bricks in time-of-impact order
+        if self.ball.active:
+            sweep_ball(
+                self.ball, self.paddle.rect, self.brick_field, self._on_ball_contact,
+                fraction=dt / MOVE_FRAME_MS
+            )
         
-        # Ball-brick collisions
-        self._handle_brick_collisions(current_time)
+        # Extra balls share the main ball's speed and power-up effects
+        self.extra_balls.update(
+            dt, self.paddle.rect, self.ball.speed * self.ball.speed_multiplier,
+            self._on_ball_contact
+        )
         
-        # Ball out of bounds
+        # Ball out of bounds: an extra ball takes over before a life is lost
+        if self.ball.is_out() and len(self.extra_balls):
+            self._promote_extra_ball()
         if self.ball.is_out():
             self.lives -= 1
             self.combo = 0
@@ -236,7 +457,9 @@ class Game:
                 self.state = STATE_GAME_OVER
             else:
                 self.ball.reset(self.paddle.rect)
-        
+    
+    def _update_powerups(self, dt, current_time):
+        """Move falling power-ups and apply any the paddle collects."""
         # Update power-ups
         expired = self.powerup_manager.update(dt, current_time)
         
@@ -244,15 +467,16 @@ class Game:
         collected, duration = self.powerup_manager.check_collision(
             self.paddle.rect, current_time
         )
-        if collected:
+        if collected == POWERUP_MULTIBALL:
+            self.spawn_balls(MULTIBALL_SPLIT)
+        elif collected:
             self.paddle.activate_powerup(collected, duration)
-        
-        # Update particles
-        self.particles.update(dt)
-        
+    
+    def _update_bullets(self, dt, current_time, inputs):
+        """Fire bullets while the power-up is active and move them."""
         # Handle bullet firing
         if self.powerup_manager.is_active(POWERUP_BULLET):
-            if pygame.mouse.get_pressed()[0]:
+            if inputs.fire:
                 if current_time - self.last_bullet_time > BULLET_COOLDOWN:
                     self._fire_bullet()
                     self.last_bullet_time = current_time
@@ -260,103 +484,110 @@ class Game:
         # Update bullets
         self.bullets.update(dt)
         self._handle_bullet_collisions(current_time)
-        
-        # Check level complete
-        if len(self.bricks) == 0:
-            self.state = STATE_LEVEL_COMPLETE
     
-    def _handle_brick_collisions(self, current_time):
-        """Handle ball-brick collisions."""
-        for brick in self.bricks:
-            if self.ball.rect.colliderect(brick.rect):
-                # Calculate collision response
-                self._resolve_brick_collision(brick)
-                
-                # Handle brick hit
-                destroyed = brick.hit()
-                
-                if destroyed:
-                    self.combo += 1
-                    points = brick.score * (1 + self.combo // 5)  # Combo bonus
-                    self.score += points
-                    self.paddle.show_score(points)
-                    
-                    # Spawn particles
-                    self._spawn_particles(brick)
-                    
-                    # Maybe spawn power-up
-                    self.powerup_manager.spawn_powerup(
-                        brick.rect.centerx,
-                        brick.rect.centery,
-                        self.assets.star
-                    )
-                    
-                    brick.kill()
-                
-                break  # Only handle one collision per frame
-    
-    def _resolve_brick_collision(self, brick):
-        """Resolve ball-brick collision with proper reflection."""
-        ball_rect = self.ball.rect
-        brick_rect = brick.rect
-        
-        # Determine collision side
-        dx = ball_rect.centerx - brick_rect.centerx
-        dy = ball_rect.centery - brick_rect.centery
-        
-        # Width and height of combined rects
-        w = (ball_rect.width + brick_rect.width) / 2
-        h = (ball_rect.height + brick_rect.height) / 2
-        
-        # Calculate overlap
-        cross_w = w * dy
-        cross_h = h * dx
-        
-        if abs(dx) <= w and abs(dy) <= h:
-            if cross_w > cross_h:
-                if cross_w > -cross_h:
-                    # Bottom collision
-                    self.ball.velocity.y = abs(self.ball.velocity.y)
-                    self.ball.rect.top = brick_rect.bottom + 1
-                else:
-                    # Left collision
-                    self.ball.velocity.x = -abs(self.ball.velocity.x)
-                    self.ball.rect.right = brick_rect.left - 1
-            else:
-                if cross_w > -cross_h:
-                    # Right collision
-                    self.ball.velocity.x = abs(self.ball.velocity.x)
-                    self.ball.rect.left = brick_rect.right + 1
-                else:
-                    # Top collision
-                    self.ball.velocity.y = -abs(self.ball.velocity.y)
-                    self.ball.rect.bottom = brick_rect.top - 1
+    def spawn_balls(self, count):
+        """Release count extra balls from the main ball, launching it if needed."""
+        if not self.ball.active:
+            self.ball.launch()
+        self.extra_balls.split_from(self.ball, count)
     
-    def _spawn_particles(self, brick):
-        """Spawn particles when a brick is destroyed."""
-        particle_img = self.assets.get_particle_sprite(brick.get_particle_type())
+    def _promote_extra_ball(self):
+        """Replace the lost main ball with one of the extra balls."""
+        x, y, vx, vy = self.extra_balls.pop()
+        self.ball.pos.update(x, y)
+        self.ball.velocity.update(vx, vy)
+        self.ball.sync_rect()
+        self.ball.prev_topleft = self.ball.rect.topleft
+    
+    def _on_ball_contact(self, kind, target):
+        """Handle a contact reported by the swept ball solver."""
+        if kind == CONTACT_BRICK:
+            with self.frame_profiler.span("update.bricks"):
+                self._hit_brick(target)
+            return
         
-        for _ in range(PARTICLE_COUNT):
-            particle = Particle(
+        if self.assets.thud_sound:
+            self.assets.thud_sound.play()
+        if kind == CONTACT_PADDLE:
+            self.combo = 0  # Reset combo on paddle hit
+    
+    def _hit_brick(self, brick):
+        """Handle the ball hitting a brick."""
+        destroyed = brick.hit()
+        if not destroyed:
+            self._brick_changed(brick)
+        
+        if destroyed:
+            self.combo += 1
+            points = brick.score * (1 + self.combo // 5)  # Combo bonus
+            self.score += points
+            self.paddle.show_score(points)
+            
+            # Spawn particles
+            self._spawn_particles(brick)
+            
+            # Maybe spawn power-up
+            self.powerup_manager.spawn_powerup(
                 brick.rect.centerx,
                 brick.rect.centery,
-                particle_img
+                self.assets.star
             )
-            self.particles.add(particle)
+            
+            self._remove_brick(brick)
+    
+    def _remove_brick(self, brick):
+        """Remove a destroyed brick from the level."""
+        self.brick_field.remove(brick)
+        self._brick_changed(brick)
+    
+    def _brick_changed(self, brick):
+        """Repaint a brick's area of the brick layer after it cracked or was removed."""
+        self.brick_layer.patch(brick.rect, self.brick_field.draw_items(brick.rect))
+        self.dirty_renderer.invalidate(brick.rect)
+    
+    def _spawn_particles(self, brick):
+        """Spawn particles when a brick is destroyed."""
+        self.particles.spawn(
+            brick.rect.centerx,
+            brick.rect.centery,
+            brick.get_particle_type(),
+            PARTICLE_COUNT
+        )
     
     def _fire_bullet(self):
         """Fire a bullet from the paddle."""
-        bullet = Bullet(
+        bullet = self.bullet_pool.acquire(
             self.paddle.rect.centerx,
             self.paddle.rect.top - 20,
             self.assets.bullet
         )
         self.bullets.add(bullet)
     
+    def sprite_counts(self):
+        """Get the number of live objects of each kind."""
+        return {
+            "bricks": len(self.brick_field),
+            "balls": 1 + len(self.extra_balls),
+            "particles": len(self.particles),
+            "bullets": len(self.bullets),
+            "powerups": len(self.powerup_manager.powerup_group),
+        }
+    
+    def pool_stats(self):
+        """Get hit rates and high-water marks of the sprite pools by name."""
+        stats = {
+            "bullets": self.bullet_pool.stats(),
+            "powerups": self.powerup_manager.pool.stats(),
+        }
+        particle_pool = getattr(self.particles, "pool", None)  # Only the sprite fallback pools
+        if particle_pool is not None:
+            stats["particles"] = particle_pool.stats()
+        return stats
+    
     def _handle_bullet_collisions(self, current_time):
         """Handle bullet-brick collisions."""
         for bullet in self.bullets:
-            for brick in self.bricks:
+            for brick in self.brick_field.query(bullet.rect):
                 if bullet.rect.colliderect(brick.rect):
                     bullet.kill()
                     
@@ -367,44 +598,102 @@ class Game:
                     self.paddle.show_score(points)
                     
                     self._spawn_particles(brick)
-                    brick.kill()
+                    self._remove_brick(brick)
                     
                     break
     
-    def _draw(self):
-        """Render the game."""
-        # Draw background
-        self.screen.blit(self.bg_surface, (0, 0))
+    def _draw(self, alpha=1.0):
+        """
+        Render the game.
+        alpha is how far (0-1) the render time is between the last two ticks.
+        """
+        self._frame_changed = True
+        self._presented_dirty = self.render_mode == RENDER_MODE_DIRTY and self.state == STATE_PLAYING
+        
+        if self.state == STATE_PLAYING:
+            self.frozen_key = None
+        else:
+            # Idle screens only change with these; otherwise keep the frame already shown
+            key = (
+                self.state, self.score, self.level_manager.get_current_level_num(),
+                self.assets.is_ready() or self.assets.load_error or round(self.assets.get_progress(), 1)
+            )
+            if key == self.frozen_key:
+                self._frame_changed = False
+                return
+            self.frozen_key = key
+        
+        if self._presented_dirty:
+            self._draw_dirty(alpha)
+            return
+        self.dirty_renderer.invalidate_all()
         
         if self.state == STATE_MENU:
+            # Draw background
+            self.screen.blit(self.bg_surface, (0, 0))
             self._draw_menu()
-        elif self.state in (STATE_PLAYING, STATE_PAUSED):
-            self._draw_game()
+            return
+        
+        # Draw background with the bricks already composited on it
+        with self.frame_profiler.span("draw.background"):
+            self.screen.blit(self.brick_layer.surface, (0, 0))
+        
+        if self.state in (STATE_PLAYING, STATE_PAUSED):
+            self._draw_game(alpha)
             if self.state == STATE_PAUSED:
                 self._draw_overlay("PAUSED", "Press SPACE to continue")
         elif self.state == STATE_GAME_OVER:
-            self._draw_game()
+            self._draw_game(alpha)
             self._draw_overlay("GAME OVER", f"Final Score: {self.score}", "Press SPACE to restart")
         elif self.state == STATE_LEVEL_COMPLETE:
-            self._draw_game()
+            self._draw_game(alpha)
             self._draw_overlay(
                 f"LEVEL {self.level_manager.get_current_level_num()} COMPLETE!",
                 f"Score: {self.score}",
                 "Press SPACE for next level"
             )
         elif self.state == STATE_WIN:
-            self._draw_game()
+            self._draw_game(alpha)
             self._draw_overlay("YOU WIN!", f"Final Score: {self.score}", "Press SPACE to play again")
     
+    def _draw_dirty(self, alpha):
+        """Erase last frame's sprites and draw this frame's, tracking what changed."""
+        with self.frame_profiler.span("draw.background"):
+            if self.dirty_renderer.begin_frame(self._restore_static):
+                self.screen.blit(self.brick_layer.surface, (0, 0))
+        
+        rects = []
+        self._draw_game(alpha, rects)
+        self.dirty_renderer.track(rects)
+    
+    def _restore_static(self, rect):
+        """Repaint the background and bricks inside rect."""
+        self.screen.blit(self.brick_layer.surface, rect, rect)
+    
+    def _present(self):
+        """Show the frame: changed regions only in dirty-rect mode, else a full flip."""
+        if self._presented_dirty:
+            self.dirty_renderer.present()
+        elif self._frame_changed:
+            pygame.display.flip()
+    
     def _draw_menu(self):
         """Draw the main menu."""
         # Title
-        title = self.font_large.render("BRICK BREAKER", True, NEON_BLUE)
+        title = self.text_cache.render(self.font_large, "BRICK BREAKER", NEON_BLUE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(title, title_rect)
         
-        # Subtitle with glow effect
-        subtitle = self.font_medium.render("Press SPACE or CLICK to Start", True, WHITE)
+        # Subtitle with glow effect (or load progress while assets stream in)
+        if self.assets.is_ready():
+            subtitle = self.text_cache.render(self.font_medium, "Press SPACE or CLICK to Start", WHITE)
+        elif self.assets.load_error is not None:
+            subtitle = self.text_cache.render(self.font_medium, "Could not load game assets", NEON_PINK)
+            detail = self.text_cache.render(self.font_small, str(self.assets.load_error)[:80], (150, 150, 170))
+            self.screen.blit(detail, detail.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 45)))
+        else:
+            percent = int(self.assets.get_progress() * 100)
+            subtitle = self.text_cache.render(self.font_medium, f"Loading... {percent}%", WHITE)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -419,83 +708,98 @@ class Game:
         
         y = SCREEN_HEIGHT * 2 // 3
         for instruction in instructions:
-            text = self.font_small.render(instruction, True, (150, 150, 170))
+            text = self.text_cache.render(self.font_small, instruction, (150, 150, 170))
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
             self.screen.blit(text, rect)
             y += 35
     
-    def _draw_game(self):
-        """Draw the game elements."""
-        # Draw bricks
-        self.bricks.draw(self.screen)
-        
-        # Draw particles
-        self.particles.draw(self.screen)
-        
-        # Draw power-ups
-        self.powerup_manager.draw(self.screen)
-        
-        # Draw bullets
-        self.bullets.draw(self.screen)
-        
-        # Draw paddle
-        self.screen.blit(self.paddle.image, self.paddle.rect)
+    def _draw_game(self, alpha=1.0, rects=None):
+        """
+        Draw the game elements, interpolating moving sprites by alpha.
+        If rects is a list, the screen areas drawn over are appended to it.
+        """
+        # Bricks are part of the brick layer blitted by the caller
+        prof = self.frame_profiler
+        
+        with prof.span("draw.particles"):
+            self.particles.draw(self.screen, rects)
+        
+        with prof.span("draw.powerups"):
+            self.powerup_manager.draw(self.screen, alpha, rects)
+        
+        with prof.span("draw.sprites"):
+            # Draw bullets
+            drawn = self.screen.blits(
+                [(bullet.image, interpolate_topleft(bullet, alpha)) for bullet in self.bullets]
+            )
+            
+            # Draw paddle
+            drawn.append(self.screen.blit(self.paddle.image, interpolate_topleft(self.paddle, alpha)))
+            
+            # Draw balls
+            drawn.append(self.screen.blit(self.ball.image, interpolate_topleft(self.ball, alpha)))
+            self.extra_balls.draw(self.screen, self.ball.image, alpha, drawn)
         
-        # Draw ball
-        self.screen.blit(self.ball.image, self.ball.rect)
+        with prof.span("draw.hud"):
+            drawn.extend(self._draw_ui())
+            if self.frame_graph:
+                drawn.append(self.frame_graph.draw(self.screen, prof, (SCREEN_WIDTH - 20, 100)))
         
-        # Draw UI
-        self._draw_ui()
+        if rects is not None:
+            rects.extend(drawn)
     
     def _draw_ui(self):
-        """Draw the game UI (score, lives, level)."""
+        """Draw the game UI (score, lives, level). Returns the rects drawn."""
+        drawn = []
+        
         # Score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (20, 20))
+        score_text = self.text_cache.render_number(self.font_medium, self.score, WHITE, prefix="Score: ")
+        drawn.append(self.screen.blit(score_text, (20, 20)))
         
         # Level
-        level_text = self.font_small.render(
+        level_text = self.text_cache.render(
+            self.font_small,
             f"Level {self.level_manager.get_current_level_num()}",
-            True, NEON_BLUE
+            NEON_BLUE
         )
         level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, 25))
-        self.screen.blit(level_text, level_rect)
+        drawn.append(self.screen.blit(level_text, level_rect))
         
         # Lives (hearts)
         for i in range(self.lives):
             x = SCREEN_WIDTH - HEART_SPACING * (i + 1)
-            self.screen.blit(self.assets.heart, (x, HEART_Y))
+            drawn.append(self.screen.blit(self.assets.heart, (x, HEART_Y)))
         
         # Combo indicator
         if self.combo > 0:
-            combo_text = self.font_small.render(f"Combo: {self.combo}x", True, NEON_PINK)
+            combo_text = self.text_cache.render(self.font_small, f"Combo: {self.combo}x", NEON_PINK)
             combo_rect = combo_text.get_rect(topright=(SCREEN_WIDTH - 20, 60))
-            self.screen.blit(combo_text, combo_rect)
+            drawn.append(self.screen.blit(combo_text, combo_rect))
         
         # Power-up indicator
         active = self.powerup_manager.get_active_type()
         if active:
-            powerup_text = self.font_small.render(
-                f"Power: {active.upper()}", True, (255, 255, 0)
+            powerup_text = self.text_cache.render(
+                self.font_small, f"Power: {active.upper()}", (255, 255, 0)
             )
-            self.screen.blit(powerup_text, (20, 70))
+            drawn.append(self.screen.blit(powerup_text, (20, 70)))
+        
+        return drawn
     
     def _draw_overlay(self, title, *lines):
         """Draw a semi-transparent overlay with text."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay_surface, (0, 0))
         
         # Title
-        title_surf = self.font_large.render(title, True, NEON_BLUE)
+        title_surf = self.text_cache.render(self.font_large, title, NEON_BLUE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(title_surf, title_rect)
         
         # Additional lines
         y = SCREEN_HEIGHT // 2
         for line in lines:
-            text_surf = self.font_medium.render(line, True, WHITE)
+            text_surf = self.text_cache.render(self.font_medium, line, WHITE)
             text_rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, y))
             self.screen.blit(text_surf, text_rect)
             y += 50
@@ -503,7 +807,21 @@ class Game:
 
 def main():
     """Entry point."""
-    game = Game()
+    parser = argparse.ArgumentParser(description="Play Breakout.")
+    parser.add_argument("--pack", default=LEVEL_PACK_PATH, help="level pack file to play")
+    parser.add_argument("--endless", type=int, default=ENDLESS_SEED, metavar="SEED",
+                        help="keep going with procedural levels generated from SEED")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record each game's input for replay.py to a new numbered file "
+                             "(game.bkrc -> game-1.bkrc, game-2.bkrc, ...)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="profile every frame and write a Chrome trace to PATH on exit")
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="append frame-time telemetry to PATH as JSON lines")
+    args = parser.parse_args()
+    
+    game = Game(level_pack=args.pack, endless_seed=args.endless, record_path=args.record,
+                trace_path=args.trace, telemetry_path=args.telemetry)
     game.run()
 
 
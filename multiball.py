@@ -0,0 +1,274 @@
+"""
+Multi-ball support for Breakout.
+Extra balls live in NumPy arrays and are moved, bounced off the walls
+and the paddle, and tested against the bricks under them in batched
+array operations, so hundreds of them cost about as much as a handful.
+"""
+
+import math
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, BALL_SIZE, MOVE_FRAME_MS
+from collision import CONTACT_BRICK, CONTACT_PADDLE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BallArray:
+    """Struct-of-arrays store for the extra balls.
+    
+    Positions (top-left) and velocities are float arrays. Bricks are
+    read straight from the level's BrickField: its alive bytes are
+    viewed as a NumPy mask (so destroyed bricks drop out without any
+    bookkeeping here) and the cells under each ball come from grid
+    arithmetic, so the cost does not grow with the brick count. Each
+    tick is split into substeps short enough that no ball can skip over
+    a brick. Without NumPy the array stays empty and spawning does
+    nothing.
+    
+    The main Ball keeps its exact swept collision; these balls use
+    overlap tests per substep, which is plenty for a swarm.
+    """
+    
+    INITIAL_CAPACITY = 64
+    MAX_STEP = BALL_SIZE / 2  # Longest move per substep in pixels
+    enabled = np is not None
+    
+    def __init__(self, size=(BALL_SIZE, BALL_SIZE)):
+        self.width, self.height = size
+        self.count = 0
+        self.capacity = 0
+        
+        self.field = None  # BrickField of the current level
+        if self.enabled:
+            self._allocate(self.INITIAL_CAPACITY)
+            self.brick_alive = np.zeros(0, dtype=bool)  # View of field.alive
+            self.bricks_bottom = 0.0  # Lowest brick edge; balls below it skip the brick test
+    
+    def _allocate(self, capacity):
+        """Grow the arrays, keeping live balls."""
+        pos = np.zeros((capacity, 2), dtype=np.float64)
+        prev = np.zeros((capacity, 2), dtype=np.float64)
+        vel = np.zeros((capacity, 2), dtype=np.float64)
+        
+        if self.count:
+            n = self.count
+            pos[:n] = self.pos[:n]
+            prev[:n] = self.prev[:n]
+            vel[:n] = self.vel[:n]
+        
+        self.pos, self.prev, self.vel = pos, prev, vel
+        self.capacity = capacity
+    
+    def spawn(self, x, y, angle, speed):
+        """
+        Add a ball with top-left (x, y) moving at speed, angle degrees
+        from straight up (negative is left).
+        """
+        if not self.enabled:
+            return
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        
+        rad = math.radians(angle - 90)
+        i = self.count
+        self.pos[i] = (x, y)
+        self.prev[i] = (x, y)
+        self.vel[i] = (math.cos(rad) * speed, math.sin(rad) * speed)
+        self.count += 1
+    
+    def split_from(self, ball, count, spread=20):
+        """Add count balls leaving the main ball's position fanned around its heading."""
+        vx, vy = ball.velocity
+        heading = math.degrees(math.atan2(vy, vx)) + 90
+        speed = ball.velocity.length() or ball.speed
+        for k in range(count):
+            # Alternate sides: +spread, -spread, +2*spread, ...
+            offset = spread * (k // 2 + 1) * (1 if k % 2 == 0 else -1)
+            self.spawn(ball.pos.x, ball.pos.y, heading + offset, speed)
+    
+    def pop(self):
+        """Remove the most recently added ball. Returns (x, y, vx, vy)."""
+        self.count -= 1
+        i = self.count
+        return (*self.pos[i].tolist(), *self.vel[i].tolist())
+    
+    def set_bricks(self, field):
+        """Collide with a level's BrickField."""
+        self.field = field
+        if not self.enabled:
+            return
+        self.brick_alive = np.frombuffer(field.alive, dtype=np.bool_)
+        self.bricks_bottom = float(field.origin_y + field.rows * field.pitch_y)
+        
+        # Cells a ball can overlap, as offsets from the one under its
+        # top-left corner in row-major order (2x2 unless bricks are
+        # smaller than a ball)
+        span_cols = -(-self.width // field.pitch_x) + 1
+        span_rows = -(-self.height // field.pitch_y) + 1
+        self.cell_cols = np.tile(np.arange(span_cols), span_rows)
+        self.cell_rows = np.repeat(np.arange(span_rows), span_cols)
+    
+    def update(self, dt, paddle_rect, speed, on_contact):
+        """
+        Move every ball by dt milliseconds at the given speed.
+        Calls on_contact(CONTACT_BRICK, brick) for each brick hit and
+        on_contact(CONTACT_PADDLE, None) once if any ball hit the paddle.
+        Wall bounces are not reported. Balls that fall off the bottom are removed.
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        self.prev[:n] = pos
+        
+        # Keep every ball at the current speed (power-ups change it)
+        length = np.hypot(vel[:, 0], vel[:, 1])
+        length[length == 0] = 1
+        vel *= (speed / length)[:, None]
+        
+        scale = dt / MOVE_FRAME_MS
+        steps = max(1, math.ceil(speed * scale / self.MAX_STEP))
+        paddle_hit = False
+        
+        for _ in range(steps):
+            pos += vel * (scale / steps)
+            self._bounce_walls(pos, vel)
+            paddle_hit |= self._bounce_paddle(pos, vel, paddle_rect)
+            self._hit_bricks(pos, vel, on_contact)
+        
+        if paddle_hit:
+            on_contact(CONTACT_PADDLE, None)
+        
+        # Drop balls that fell out, compacting the arrays
+        keep = pos[:, 1] <= SCREEN_HEIGHT
+        if not keep.all():
+            kept = int(keep.sum())
+            self.pos[:kept] = pos[keep]
+            self.prev[:kept] = self.prev[:n][keep]
+            self.vel[:kept] = vel[keep]
+            self.count = kept
+    
+    def _bounce_walls(self, pos, vel):
+        """Reflect balls off the left, right and top edges."""
+        x, y = pos[:, 0], pos[:, 1]
+        
+        hit = x < 0
+        x[hit] = 0
+        vel[hit, 0] = np.abs(vel[hit, 0])
+        
+        hit = x > SCREEN_WIDTH - self.width
+        x[hit] = SCREEN_WIDTH - self.width
+        vel[hit, 0] = -np.abs(vel[hit, 0])
+        
+        hit = y < 0
+        y[hit] = 0
+        vel[hit, 1] = np.abs(vel[hit, 1])
+    
+    def _bounce_paddle(self, pos, vel, paddle_rect):
+        """
+        Deflect falling balls that overlap the paddle, at an angle set by
+        where they hit it (same rule as Ball.deflect_from_paddle).
+        Returns True if any ball bounced.
+        """
+        x, y = pos[:, 0], pos[:, 1]
+        hit = (
+            (vel[:, 1] > 0)
+            & (x < paddle_rect.right) & (x + self.width > paddle_rect.left)
+            & (y < paddle_rect.bottom) & (y + self.height > paddle_rect.top)
+        )
+        if not hit.any():
+            return False
+        
+        # Hit position relative to the paddle centre (-1 to 1), up to 60 degrees from vertical
+        relative = (x[hit] + self.width / 2 - paddle_rect.centerx) / (paddle_rect.width / 2)
+        rad = np.radians(np.clip(relative, -1, 1) * 60 - 90)
+        speed = np.hypot(vel[hit, 0], vel[hit, 1])
+        vel[hit, 0] = np.cos(rad) * speed
+        vel[hit, 1] = np.sin(rad) * speed
+        y[hit] = paddle_rect.top - self.height
+        return True
+    
+    def _hit_bricks(self, pos, vel, on_contact):
+        """Bounce balls off the bricks they overlap and report the hits."""
+        if not self.brick_alive.any():
+            return
+        
+        # Only balls level with the brick rows can touch a brick
+        near = np.flatnonzero(pos[:, 1] < self.bricks_bottom)
+        if near.size == 0:
+            return
+        
+        # Test each ball against the cells it can overlap (see set_bricks)
+        field = self.field
+        x = pos[near, 0][:, None]
+        y = pos[near, 1][:, None]
+        col = np.floor((x - field.origin_x) / field.pitch_x).astype(np.intp) + self.cell_cols
+        row = np.floor((y - field.origin_y) / field.pitch_y).astype(np.intp) + self.cell_rows
+        inside = (col >= 0) & (col < field.cols) & (row >= 0) & (row < field.rows)
+        cells = np.where(inside, row * field.cols + col, 0)
+        
+        left = field.origin_x + col * field.pitch_x
+        top = field.origin_y + row * field.pitch_y
+        overlap = (
+            inside & self.brick_alive[cells]
+            & (x < left + field.brick_w) & (x + self.width > left)
+            & (y < top + field.brick_h) & (y + self.height > top)
+        )
+        hitting = np.flatnonzero(overlap.any(axis=1))
+        
+        # Few balls hit a brick in any one substep, so resolve them one by one
+        for hit in hitting.tolist():
+            j = int(cells[hit, overlap[hit].argmax()])
+            if not self.brick_alive[j]:
+                continue  # Destroyed by an earlier ball this substep
+            
+            i = near[hit]
+            rect = field.cell_rect(j)
+            left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+            bx, by = pos[i].tolist()
+            
+            # Push out along the axis of least penetration
+            overlap_x = min(bx + self.width, right) - max(bx, left)
+            overlap_y = min(by + self.height, bottom) - max(by, top)
+            if overlap_x < overlap_y:
+                if bx + self.width / 2 < (left + right) / 2:
+                    pos[i, 0] = left - self.width
+                    vel[i, 0] = -abs(vel[i, 0])
+                else:
+                    pos[i, 0] = right
+                    vel[i, 0] = abs(vel[i, 0])
+            else:
+                if by + self.height / 2 < (top + bottom) / 2:
+                    pos[i, 1] = top - self.height
+                    vel[i, 1] = -abs(vel[i, 1])
+                else:
+                    pos[i, 1] = bottom
+                    vel[i, 1] = abs(vel[i, 1])
+            
+            on_contact(CONTACT_BRICK, field.brick(j))
+    
+    def draw(self, screen, image, alpha=1.0, rects=None):
+        """
+        Draw every ball, interpolated between the last two ticks.
+        If rects is a list, the drawn areas are appended to it.
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        prev = self.prev[:n]
+        topleft = np.rint(prev + (self.pos[:n] - prev) * alpha).astype(np.int32).tolist()
+        drawn = screen.blits([(image, xy) for xy in topleft], doreturn=rects is not None)
+        if rects is not None:
+            rects.extend(drawn)
+    
+    def clear(self):
+        """Remove every ball."""
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
@@ -0,0 +1,179 @@
+"""
+Particle systems for Breakout.
+Brick debris is simulated in contiguous NumPy arrays when NumPy is
+available, falling back to one Particle sprite per fragment otherwise.
+"""
+
+import math
+import pygame
+import random
+from config import (
+    PARTICLE_SIZE, PARTICLE_SPEED, PARTICLE_LIFETIME, PARTICLE_GRAVITY, MOVE_FRAME_MS
+)
+from entities import Particle
+from pool import ObjectPool, kill_all
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ArrayParticleSystem:
+    """Struct-of-arrays particle engine.
+    
+    Positions, velocities, ages and particle types live in preallocated
+    arrays. Gravity, movement and fading are applied to every live
+    particle at once, and expired particles are removed by compacting
+    the arrays. Drawing looks up each particle's pre-faded frame from
+    the AssetManager and issues a single Surface.blits() call.
+    """
+    
+    INITIAL_CAPACITY = 1024
+    
+    def __init__(self, assets, seed=None):
+        self.assets = assets
+        self.reseed(seed)
+        self.count = 0
+        self._allocate(self.INITIAL_CAPACITY)
+    
+    def reseed(self, seed=None):
+        """Restart the particle random stream."""
+        self.rng = np.random.default_rng(seed)
+    
+    def _allocate(self, capacity):
+        """Grow the particle arrays to hold at least capacity particles."""
+        pos = np.zeros((capacity, 2), dtype=np.float32)
+        vel = np.zeros((capacity, 2), dtype=np.float32)
+        age = np.zeros(capacity, dtype=np.float32)
+        ptype = np.zeros(capacity, dtype=np.int16)
+        
+        if self.count:
+            n = self.count
+            pos[:n] = self.pos[:n]
+            vel[:n] = self.vel[:n]
+            age[:n] = self.age[:n]
+            ptype[:n] = self.ptype[:n]
+        
+        self.pos, self.vel, self.age, self.ptype = pos, vel, age, ptype
+        self.capacity = capacity
+    
+    def spawn(self, x, y, particle_type, count):
+        """Spawn a burst of particles at (x, y)."""
+        if self.count + count > self.capacity:
+            self._allocate(max(self.capacity * 2, self.count + count))
+        
+        start, end = self.count, self.count + count
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        speed = self.rng.uniform(2, PARTICLE_SPEED, count)
+        
+        self.pos[start:end, 0] = x
+        self.pos[start:end, 1] = y
+        self.vel[start:end, 0] = np.cos(angle) * speed
+        self.vel[start:end, 1] = np.sin(angle) * speed
+        self.age[start:end] = 0
+        self.ptype[start:end] = particle_type
+        self.count = end
+    
+    def update(self, dt):
+        """Age, move and cull all particles."""
+        n = self.count
+        if n == 0:
+            return
+        
+        age = self.age[:n]
+        age += dt
+        
+        # Compact survivors to the front of the arrays
+        alive = age < PARTICLE_LIFETIME
+        if not alive.all():
+            n = int(np.count_nonzero(alive))
+            self.pos[:n] = self.pos[:self.count][alive]
+            self.vel[:n] = self.vel[:self.count][alive]
+            self.age[:n] = age[alive]
+            self.ptype[:n] = self.ptype[:self.count][alive]
+            self.count = n
+        
+        # Apply gravity, then move (speeds are per MOVE_FRAME_MS)
+        scale = dt / MOVE_FRAME_MS
+        vel = self.vel[:n]
+        vel[:, 1] += PARTICLE_GRAVITY * scale
+        self.pos[:n] += vel * scale
+    
+    def draw(self, screen, rects=None):
+        """
+        Draw all particles, faded by age.
+        If rects is a list, the drawn areas are appended to it.
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        levels = self.assets.particle_alpha_levels
+        frames = self.assets.particle_fade_frames
+        
+        alpha = (255 * (1 - self.age[:n] / PARTICLE_LIFETIME)).astype(np.int32)
+        frame_idx = self.ptype[:n] * levels + (alpha * (levels - 1) + 127) // 255
+        topleft = (self.pos[:n] - PARTICLE_SIZE / 2).astype(np.int32)
+        
+        # Flat int lists and nested zips: blits drops each item before
+        # pulling the next, so zip reuses its tuples instead of allocating
+        # a (frame, (x, y)) pair per particle.
+        dests = zip(topleft[:, 0].tolist(), topleft[:, 1].tolist())
+        drawn = screen.blits(
+            zip(map(frames.__getitem__, frame_idx.tolist()), dests),
+            doreturn=rects is not None
+        )
+        if rects is not None:
+            rects.extend(drawn)
+    
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+
+
+class SpriteParticleSystem:
+    """Fallback particle system with one pooled Particle sprite per fragment."""
+    
+    def __init__(self, assets, seed=None):
+        self.assets = assets
+        self.group = pygame.sprite.Group()
+        self.pool = ObjectPool(Particle)
+        self.reseed(seed)
+    
+    def reseed(self, seed=None):
+        """Restart the particle random stream."""
+        self.rng = random.Random(seed)
+    
+    def spawn(self, x, y, particle_type, count):
+        """Spawn a burst of particles at (x, y)."""
+        frames = self.assets.particle_fades[particle_type]
+        for _ in range(count):
+            self.group.add(self.pool.acquire(x, y, frames, self.rng))
+    
+    def update(self, dt):
+        """Update all particles."""
+        self.group.update(dt)
+    
+    def draw(self, screen, rects=None):
+        """Draw all particles. If rects is a list, the drawn areas are appended to it."""
+        drawn = self.group.draw(screen)
+        if rects is not None:
+            rects.extend(drawn)
+    
+    def clear(self):
+        """Remove all particles."""
+        kill_all(self.group)
+    
+    def __len__(self):
+        return len(self.group)
+
+
+def create_particle_system(assets, seed=None):
+    """Create the fastest particle system available."""
+    if np is not None:
+        return ArrayParticleSystem(assets, seed)
+    return SpriteParticleSystem(assets, seed)
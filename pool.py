@@ -0,0 +1,87 @@
+"""
+Object pooling for Breakout.
+Short-lived sprites (bullets, power-ups, fallback particles) are
+recycled through free lists instead of being reallocated, which keeps
+the garbage collector quiet during long bullet combos.
+"""
+
+import pygame
+
+
+class ObjectPool:
+    """Free list of reusable objects built by factory.
+    
+    acquire() pops a released object and calls its reset() with the
+    same arguments the factory takes, or builds a new one when the free
+    list is empty. Hit rate and the high-water mark of objects in use
+    tell how well the pool is sized.
+    """
+    
+    def __init__(self, factory, max_free=None):
+        self.factory = factory
+        self.max_free = max_free  # Cap on idle objects kept around (None = no cap)
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+    
+    def acquire(self, *args, **kwargs):
+        """Get an object initialised with the given arguments."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            obj.pool = self
+            self.misses += 1
+        
+        obj.in_pool = False
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+    
+    def release(self, obj):
+        """Return an object to the free list (releasing twice is a no-op)."""
+        if obj.in_pool:
+            return
+        obj.in_pool = True
+        self.in_use -= 1
+        if self.max_free is None or len(self.free) < self.max_free:
+            self.free.append(obj)
+    
+    def get_hit_rate(self):
+        """Fraction of acquires served from the free list."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def stats(self):
+        """Get the pool counters as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.get_hit_rate(),
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+        }
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that returns itself to its pool when killed."""
+    
+    pool = None      # Set by ObjectPool.acquire
+    in_pool = False  # True while sitting in the free list
+    
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+def kill_all(group):
+    """Kill every sprite in a group, so pooled ones go back to their pools."""
+    for sprite in group.sprites():
+        sprite.kill()
@@ -6,55 +6,76 @@ import pygame
 import random
 from config import (
     POWERUP_SPEED, POWERUP_DROP_CHANCE, POWERUP_DURATION,
-    POWERUP_SLOW, POWERUP_FAST, POWERUP_BULLET,
-    SCREEN_HEIGHT
+    POWERUP_SLOW, POWERUP_FAST, POWERUP_BULLET, POWERUP_MULTIBALL,
+    SCREEN_HEIGHT, MOVE_FRAME_MS
 )
+from entities import interpolate_topleft
+from pool import ObjectPool, PooledSprite, kill_all
 
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(PooledSprite):
     """A falling power-up collectible."""
     
-    TYPES = [POWERUP_SLOW, POWERUP_FAST, POWERUP_BULLET]
+    TYPES = [POWERUP_SLOW, POWERUP_FAST, POWERUP_BULLET, POWERUP_MULTIBALL]
+    INSTANT_TYPES = {POWERUP_MULTIBALL}  # Applied once on pickup rather than for a duration
     
-    def __init__(self, x, y, image, powerup_type=None):
+    def __init__(self, x, y, image, powerup_type=None, rng=random):
         super().__init__()
+        self.rect = image.get_rect()
+        self.reset(x, y, image, powerup_type, rng)
+    
+    def reset(self, x, y, image, powerup_type=None, rng=random):
+        """(Re)initialise the power-up; reuses its Rect when pooled."""
         self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect.size = image.get_size()
+        self.rect.center = (x, y)
+        self.prev_topleft = self.rect.topleft
+        self.y = float(self.rect.y)
         self.speed = POWERUP_SPEED
         
         # Random type if not specified
-        self.powerup_type = powerup_type or random.choice(self.TYPES)
+        self.powerup_type = powerup_type or rng.choice(self.TYPES)
     
-    def update(self, dt=0):
+    def update(self, dt=MOVE_FRAME_MS):
         """Move power-up downward."""
-        self.rect.y += self.speed
+        self.prev_topleft = self.rect.topleft
+        self.y += self.speed * dt / MOVE_FRAME_MS
+        self.rect.y = round(self.y)
         
         # Remove if off screen
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
     
     @staticmethod
-    def should_spawn():
+    def should_spawn(rng=random):
         """Determine if a power-up should spawn (random chance)."""
-        return random.random() < POWERUP_DROP_CHANCE
+        return rng.random() < POWERUP_DROP_CHANCE
     
     def get_duration(self):
-        """Get the power-up duration in milliseconds."""
-        return POWERUP_DURATION
+        """Get the power-up duration in milliseconds (0 for instant power-ups)."""
+        return 0 if self.powerup_type in self.INSTANT_TYPES else POWERUP_DURATION
 
 
 class PowerUpManager:
     """Manages active power-ups and their effects."""
     
-    def __init__(self):
+    def __init__(self, rng=random, types=PowerUp.TYPES):
+        self.rng = rng  # Source of drop chances and power-up types
+        self.types = types  # Types that can drop
         self.active_powerups = {}  # type -> end_time
         self.powerup_group = pygame.sprite.Group()
+        self.pool = ObjectPool(PowerUp)
+        
+        # Lifetime totals, for balancing stats (not reset by clear())
+        self.spawned = 0
+        self.collected = 0
     
     def spawn_powerup(self, x, y, star_image):
         """Spawn a power-up at the given position."""
-        if PowerUp.should_spawn():
-            powerup = PowerUp(x, y, star_image)
+        if PowerUp.should_spawn(self.rng):
+            powerup = self.pool.acquire(x, y, star_image, self.rng.choice(self.types))
             self.powerup_group.add(powerup)
+            self.spawned += 1
             return powerup
         return None
     
@@ -97,16 +118,26 @@ class PowerUpManager:
             if powerup.rect.colliderect(paddle_rect):
                 ptype = powerup.powerup_type
                 duration = powerup.get_duration()
-                self.activate(ptype, current_time, duration)
+                if ptype not in PowerUp.INSTANT_TYPES:
+                    self.activate(ptype, current_time, duration)
                 powerup.kill()
+                self.collected += 1
                 return ptype, duration
         return None, 0
     
-    def draw(self, screen):
-        """Draw all power-ups."""
-        self.powerup_group.draw(screen)
+    def draw(self, screen, alpha=1.0, rects=None):
+        """
+        Draw all power-ups, interpolated between the last two ticks.
+        If rects is a list, the drawn areas are appended to it.
+        """
+        drawn = screen.blits(
+            [(powerup.image, interpolate_topleft(powerup, alpha)) for powerup in self.powerup_group],
+            doreturn=rects is not None
+        )
+        if rects is not None:
+            rects.extend(drawn)
     
     def clear(self):
         """Clear all power-ups."""
-        self.powerup_group.empty()
+        kill_all(self.powerup_group)
         self.active_powerups.clear()
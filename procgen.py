@@ -0,0 +1,118 @@
+"""
+Procedural levels for Breakout's endless mode.
+Layouts are generated from (seed, level) alone, so a seed always plays
+the same sequence. A background worker generates the next few levels
+while the current one is played and keeps them in a bounded cache.
+"""
+
+from collections import OrderedDict
+import queue
+import random
+import threading
+from config import (
+    BRICK_ROWS, BRICK_COLS, PROCGEN_MAX_ROWS, PROCGEN_RAMP_LEVELS,
+    PROCGEN_LOOKAHEAD, PROCGEN_CACHE_SIZE
+)
+from levelpack import encode_pattern
+
+MAX_BRICK_TYPE = 9
+
+
+def generate_pattern(seed, level):
+    """
+    Generate the brick pattern for a 0-indexed level (rows of brick
+    types, -1 for empty). Later levels have more rows, fewer gaps and
+    higher brick types.
+    """
+    rng = random.Random(seed * 1000003 + level)
+    difficulty = min(level / PROCGEN_RAMP_LEVELS, 1.0)
+    
+    rows = BRICK_ROWS + round(difficulty * (PROCGEN_MAX_ROWS - BRICK_ROWS))
+    density = 0.5 + 0.45 * difficulty
+    top_type = min(MAX_BRICK_TYPE, 2 + level // 2)
+    mode = top_type * difficulty
+    
+    # Fill the left half and mirror it, so layouts look designed
+    half = (BRICK_COLS + 1) // 2
+    pattern = []
+    for row in range(rows):
+        # Rows near the top are tougher
+        row_bonus = (rows - 1 - row) / max(rows - 1, 1)
+        cells = []
+        for _ in range(half):
+            if rng.random() < density:
+                brick_type = rng.triangular(0, top_type + 1, min(mode + row_bonus * 2, top_type + 1))
+                cells.append(min(int(brick_type), top_type))
+            else:
+                cells.append(-1)
+        pattern.append(cells + cells[:BRICK_COLS - half][::-1])
+    
+    if all(cell < 0 for row in pattern for cell in row):
+        pattern[0][half - 1] = 0  # Never generate an empty level
+    return pattern
+
+
+class ProceduralLevels:
+    """Seeded level source with background pre-generation.
+    
+    get() returns encoded levels as (cols, rows, cells), the same shape
+    LevelPack.get_level() returns. prefetch() queues upcoming levels for
+    the worker thread; a level that is not ready yet is generated on the
+    spot, so get() never waits on the worker. The cache is an LRU keyed
+    by (seed, level) and holds at most cache_size levels.
+    """
+    
+    def __init__(self, seed, lookahead=PROCGEN_LOOKAHEAD, cache_size=PROCGEN_CACHE_SIZE):
+        self.seed = seed
+        self.lookahead = lookahead
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # (seed, level) -> (cols, rows, cells)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        self._requests = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="level-generator", daemon=True)
+        self._worker.start()
+    
+    def _run(self):
+        """Worker thread: generate queued levels until stopped."""
+        while True:
+            key = self._requests.get()
+            if key is None:
+                return
+            with self.lock:
+                if key in self.cache:
+                    continue
+            self._store(key, encode_pattern(generate_pattern(*key)))
+    
+    def _store(self, key, level):
+        with self.lock:
+            self.cache[key] = level
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+    
+    def get(self, level):
+        """Get a 0-indexed level as (cols, rows, cells)."""
+        key = (self.seed, level)
+        with self.lock:
+            encoded = self.cache.get(key)
+            if encoded is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return encoded
+        
+        self.misses += 1
+        encoded = encode_pattern(generate_pattern(*key))
+        self._store(key, encoded)
+        return encoded
+    
+    def prefetch(self, level):
+        """Queue generation of the lookahead levels starting at level."""
+        for upcoming in range(level, level + self.lookahead):
+            self._requests.put((self.seed, upcoming))
+    
+    def close(self):
+        """Stop the worker thread."""
+        self._requests.put(None)
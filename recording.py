@@ -0,0 +1,160 @@
+"""
+Input recordings for Breakout.
+A recording holds a game's seed and start settings followed by the
+input of every simulated tick, so the session can be replayed exactly
+(see replay.py).
+
+Layout (little-endian):
+    header  magic b"BKRC", u16 version, u16 reserved, i64 seed,
+            u32 start level, bool endless, i64 endless seed, f64 tick ms
+    body    zlib stream of runs: u16 tick count, f64 paddle target x,
+            u8 flags (FLAG_FIRE | FLAG_LAUNCH | FLAG_STRESS)
+
+Identical consecutive ticks share one run, so idle stretches cost
+nothing and a busy minute of play is a few kilobytes.
+"""
+
+from collections import namedtuple
+import os
+import struct
+import zlib
+from config import RECORD_FLUSH_TICKS
+from controls import InputState
+
+MAGIC = b"BKRC"
+RECORDING_FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHqI?qd")
+RUN = struct.Struct("<HdB")
+MAX_RUN = 0xFFFF
+
+FLAG_FIRE = 1
+FLAG_LAUNCH = 2
+FLAG_STRESS = 4
+
+RecordingHeader = namedtuple("RecordingHeader", "seed start_level endless_seed dt")
+
+
+class RecordingError(ValueError):
+    """Raised for files that are not valid recordings."""
+
+
+def _flags(inputs):
+    return (
+        (FLAG_FIRE if inputs.fire else 0)
+        | (FLAG_LAUNCH if inputs.launch else 0)
+        | (FLAG_STRESS if inputs.stress else 0)
+    )
+
+
+def numbered_path(path):
+    """
+    Get the first of path-1.ext, path-2.ext, ... that does not exist yet,
+    so each recorded game gets its own file and none is overwritten.
+    """
+    base, ext = os.path.splitext(path)
+    number = 1
+    while os.path.exists(f"{base}-{number}{ext}"):
+        number += 1
+    return f"{base}-{number}{ext}"
+
+
+class InputRecorder:
+    """Writes one tick of input per record() call to a recording file.
+    
+    The compressed stream is sync-flushed every RECORD_FLUSH_TICKS
+    ticks, so a recording cut short by a crash is still readable up to
+    the last flush.
+    """
+    
+    def __init__(self, path, seed, start_level=0, endless_seed=None, dt=0.0):
+        self.path = path
+        self.file = open(path, "xb")  # Never overwrite an earlier recording
+        self.file.write(HEADER.pack(
+            MAGIC, RECORDING_FORMAT_VERSION, 0, seed, start_level,
+            endless_seed is not None, endless_seed or 0, dt
+        ))
+        self.compressor = zlib.compressobj()
+        self.run = None  # (target_x, flags) of the run being counted
+        self.run_length = 0
+        self.ticks = 0
+    
+    def record(self, inputs):
+        """Append the input of one tick."""
+        entry = (float(inputs.target_x), _flags(inputs))
+        if entry != self.run or self.run_length == MAX_RUN:
+            self._write_run()
+            self.run = entry
+        self.run_length += 1
+        
+        self.ticks += 1
+        if self.ticks % RECORD_FLUSH_TICKS == 0:
+            self._write_run()
+            self.file.write(self.compressor.flush(zlib.Z_SYNC_FLUSH))
+            self.file.flush()
+    
+    def _write_run(self):
+        if self.run_length:
+            self.file.write(self.compressor.compress(RUN.pack(self.run_length, *self.run)))
+            self.run_length = 0
+    
+    def close(self):
+        """Write the last run and close the file."""
+        self._write_run()
+        self.file.write(self.compressor.flush())
+        self.file.close()
+
+
+def read_recording(path):
+    """
+    Load a recording. Returns (RecordingHeader, runs) where runs is a
+    list of (tick count, target_x, flags). A truncated body yields the
+    runs before the cut.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    try:
+        magic, version, _, seed, start_level, endless, endless_seed, dt = HEADER.unpack_from(data)
+    except struct.error:
+        raise RecordingError(f"{path}: too short for a recording")
+    if magic != MAGIC:
+        raise RecordingError(f"{path}: not a recording")
+    if version != RECORDING_FORMAT_VERSION:
+        raise RecordingError(f"{path}: unsupported version {version}")
+    header = RecordingHeader(seed, start_level, endless_seed if endless else None, dt)
+    
+    try:
+        body = zlib.decompressobj().decompress(data[HEADER.size:])
+    except zlib.error as e:
+        raise RecordingError(f"{path}: damaged body ({e})")
+    usable = len(body) - len(body) % RUN.size
+    return header, list(RUN.iter_unpack(body[:usable]))
+
+
+class ReplayInput:
+    """Input source that plays back the runs of a recording."""
+    
+    def __init__(self, runs):
+        self.runs = runs
+        self.run_index = 0
+        self.left_in_run = runs[0][0] if runs else 0
+        self.ticks_left = sum(run[0] for run in runs)
+        self.last = InputState(0)
+    
+    def poll(self, game):
+        """Return the recorded input for the current tick (the last one once the recording ends)."""
+        if self.ticks_left == 0:
+            return self.last
+        
+        while self.left_in_run == 0:
+            self.run_index += 1
+            self.left_in_run = self.runs[self.run_index][0]
+        _, target_x, flags = self.runs[self.run_index]
+        self.left_in_run -= 1
+        self.ticks_left -= 1
+        
+        self.last = InputState(
+            target_x, fire=bool(flags & FLAG_FIRE), launch=bool(flags & FLAG_LAUNCH),
+            stress=bool(flags & FLAG_STRESS)
+        )
+        return self.last
@@ -0,0 +1,130 @@
+"""
+Dirty-rectangle rendering for Breakout.
+Tracks the screen regions touched by moving sprites and the HUD so
+each frame only erases, redraws and presents those regions.
+"""
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, DIRTY_TILE_SIZE
+
+
+class DirtyRectRenderer:
+    """Dirty region tracker working on a coarse tile grid.
+    
+    Drawn rects are snapped to DIRTY_TILE_SIZE tiles and merged into
+    horizontal runs, which bounds the number of rects handed to SDL no
+    matter how many particles are on screen. Regions drawn in one frame
+    are restored from the static layers at the start of the next.
+    """
+    
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), tile_size=DIRTY_TILE_SIZE):
+        self.width, self.height = size
+        self.tile_size = tile_size
+        self.cols = (self.width + tile_size - 1) // tile_size
+        self.rows = (self.height + tile_size - 1) // tile_size
+        
+        self.previous = []        # Rects drawn last frame, to erase this frame
+        self.current = []         # Rects drawn this frame
+        self.invalidated = []     # Static regions (bricks) that changed since last frame
+        self.full_redraw = True   # Next frame must redraw and present everything
+    
+    def invalidate(self, rect):
+        """Mark a region of the static layers as changed."""
+        self.invalidated.append(pygame.Rect(rect))
+    
+    def invalidate_all(self):
+        """Force the next frame to be drawn and presented in full."""
+        self.full_redraw = True
+        self.previous = []
+        self.invalidated = []
+    
+    def begin_frame(self, restore):
+        """
+        Start a frame: call restore(rect) for every region to erase.
+        Returns True if the whole screen must be redrawn instead.
+        """
+        self.current = []
+        if self.full_redraw:
+            return True
+        
+        for rect in self._merge(self.previous + self.invalidated):
+            restore(rect)
+        self.current.extend(self.invalidated)
+        self.invalidated = []
+        return False
+    
+    def track(self, rects):
+        """Record rects drawn during this frame."""
+        self.current.extend(rects)
+    
+    def present(self):
+        """Push the changed regions to the display."""
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+            dirty = self.current
+        else:
+            dirty = self._merge(self.previous + self.current)
+            pygame.display.update(dirty)
+        
+        self.previous = self.current
+        self.current = []
+        return dirty
+    
+    def _merge(self, rects):
+        """Snap rects to tiles and merge each tile row into horizontal runs."""
+        size = self.tile_size
+        rows = {}
+        for rect in rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            col0 = max(rect.left // size, 0)
+            col1 = min((rect.right - 1) // size, self.cols - 1)
+            row0 = max(rect.top // size, 0)
+            row1 = min((rect.bottom - 1) // size, self.rows - 1)
+            for row in range(row0, row1 + 1):
+                rows.setdefault(row, set()).update(range(col0, col1 + 1))
+        
+        merged = []
+        for row, cols in rows.items():
+            cols = sorted(cols)
+            start = prev = cols[0]
+            for col in cols[1:] + [None]:
+                if col != prev + 1:
+                    merged.append(pygame.Rect(start * size, row * size, (prev - start + 1) * size, size))
+                    start = col
+                prev = col
+        return merged
+
+
+class BrickLayer:
+    """Pre-composited playfield: the background with every live brick on it.
+    
+    Drawing the game starts with a single opaque blit of this surface
+    instead of the background plus one blit per brick. When a brick
+    cracks or is destroyed only its rect is repainted.
+    """
+    
+    def __init__(self, background):
+        self.background = background
+        self.surface = background.copy()
+    
+    def rebuild(self, bricks, background=None):
+        """
+        Recomposite the whole layer, optionally onto a new background.
+        bricks is a sequence of (image, rect) pairs (see BrickField.draw_items).
+        """
+        if background is not None:
+            self.background = background
+            if self.surface.get_size() != background.get_size():
+                self.surface = background.copy()
+        self.surface.blit(self.background, (0, 0))
+        self.surface.blits(bricks, doreturn=False)
+    
+    def patch(self, rect, bricks):
+        """Repaint rect from the background and the (image, rect) pairs overlapping it."""
+        self.surface.blit(self.background, rect, rect)
+        for image, brick_rect in bricks:
+            # Clip to rect: bricks have translucent edges that must not be blended twice
+            area = brick_rect.clip(rect)
+            self.surface.blit(image, area, area.move(-brick_rect.x, -brick_rect.y))
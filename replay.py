@@ -0,0 +1,87 @@
+"""
+Replay recorded Breakout sessions.
+Re-runs a recording made with `main.py --record PATH` from its seed and
+per-tick input, either headless at full speed (the default) or in a
+window at normal speed.
+
+Usage:
+    python replay.py session.bkrc
+    python replay.py session.bkrc --realtime
+"""
+
+import argparse
+import time
+from config import STATE_PLAYING, STATE_PAUSED, STATE_LEVEL_COMPLETE, LEVEL_PACK_PATH
+from headless import HeadlessGame
+from main import Game
+from recording import ReplayInput, RecordingError, read_recording
+
+
+class ReplayGame(Game):
+    """Windowed game driven by a recording.
+    
+    Ticks are the recording's dt long, so the replay is stepped and paced
+    as it was recorded. Levels advance on their own, and the game pauses
+    on the last recorded tick. Launch and stress keys are ignored so they cannot
+    knock the replay off the recorded input.
+    """
+    
+    def __init__(self, header, runs, level_pack=LEVEL_PACK_PATH):
+        self.replay = ReplayInput(runs)
+        super().__init__(input_source=self.replay, level_pack=level_pack,
+                         endless_seed=header.endless_seed)
+        self.sim_step = header.dt
+        self.new_game(seed=header.seed, level=header.start_level)
+    
+    def _step(self, dt):
+        self.launch_requested = False
+        self.stress_requested = False
+        super()._step(dt)
+        
+        if self.state == STATE_LEVEL_COMPLETE:
+            self.advance_level()
+        if self.state == STATE_PLAYING and self.replay.ticks_left == 0:
+            self.state = STATE_PAUSED
+
+
+def replay_headless(header, runs, level_pack=LEVEL_PACK_PATH):
+    """Run a recording at full speed. Returns the finished HeadlessGame."""
+    replay = ReplayInput(runs)
+    game = HeadlessGame(input_source=replay, dt=header.dt, level_pack=level_pack,
+                        endless_seed=header.endless_seed)
+    game.new_game(seed=header.seed, level=header.start_level)
+    while replay.ticks_left and game.state == STATE_PLAYING:
+        game.step()
+    return game
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Replay a recorded Breakout session.")
+    parser.add_argument("recording", help="file written by main.py --record")
+    parser.add_argument("--realtime", action="store_true", help="replay in a window at normal speed")
+    parser.add_argument("--pack", default=LEVEL_PACK_PATH, help="level pack the session was played with")
+    args = parser.parse_args()
+    
+    try:
+        header, runs = read_recording(args.recording)
+    except (OSError, RecordingError) as e:
+        print(f"Error loading recording: {e}")
+        return
+    
+    if args.realtime:
+        ReplayGame(header, runs, args.pack).run()
+        return
+    
+    start = time.perf_counter()
+    game = replay_headless(header, runs, args.pack)
+    elapsed = time.perf_counter() - start
+    
+    print(f"Replayed {game.ticks} ticks ({game.ticks * game.dt / 1000:.1f}s game time) "
+          f"in {elapsed:.2f}s: {game.ticks / max(elapsed, 1e-9):.0f} ticks/s")
+    print(f"State: {game.state}  Level: {game.level_manager.get_current_level_num()}  "
+          f"Score: {game.score}  Lives: {game.lives}")
+
+
+if __name__ == "__main__":
+    main()
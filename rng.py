@@ -0,0 +1,35 @@
+"""
+Seedable random streams for Breakout.
+Each subsystem draws from its own generator, all derived from one game
+seed. A session can then be replayed exactly from its seed and inputs,
+and extra draws in one subsystem (more particles, say) do not shift the
+numbers another one sees.
+"""
+
+import os
+import random
+
+
+class RandomStreams:
+    """Per-subsystem random.Random streams derived from one seed.
+    
+    The stream objects are created once and reseeded in place, so
+    subsystems can keep a reference to their stream across games.
+    """
+    
+    def __init__(self, seed=None):
+        self.ball = random.Random()      # Serve and launch angles
+        self.powerups = random.Random()  # Drop chance and power-up type
+        self.reseed(seed)
+    
+    def reseed(self, seed=None):
+        """Reseed every stream; a fresh seed is drawn when seed is None."""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little") >> 1  # Fits a signed 64-bit field
+        self.seed = seed
+        self.ball.seed(self.derive("ball"))
+        self.powerups.seed(self.derive("powerups"))
+    
+    def derive(self, name):
+        """Get a 64-bit seed for a named stream (e.g. for a NumPy generator)."""
+        return random.Random(f"{self.seed}:{name}").getrandbits(64)
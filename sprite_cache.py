@@ -0,0 +1,72 @@
+"""
+Persistent cache of pre-scaled sprites for Breakout.
+Stores scaled sprite pixels as raw RGBA files keyed by the source
+file's content hash (or, for atlas sheets, the atlas signature) and
+the size, so warm starts skip PNG decoding and smoothscale entirely.
+"""
+
+import hashlib
+import mmap
+import os
+import pygame
+from config import SPRITE_CACHE_DIR
+
+CACHE_FORMAT_VERSION = 1
+
+
+class SpriteCache:
+    """Content-addressed store of scaled sprite pixel buffers.
+    
+    Entries are named <sha1 of source>_<w>x<h>.rgba and hold exactly
+    w * h * 4 bytes, so they can be memory-mapped straight into a
+    Surface. Editing a sprite or changing a size constant produces a
+    new key, which invalidates the old entry without any bookkeeping.
+    """
+    
+    def __init__(self, cache_dir=SPRITE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+    
+    def key_for(self, path, size):
+        """Build the cache key for a source file scaled to size."""
+        digest = hashlib.sha1(f"v{CACHE_FORMAT_VERSION}".encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        return f"{digest.hexdigest()}_{size[0]}x{size[1]}"
+    
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ".rgba")
+    
+    def load(self, key, size):
+        """
+        Load a cached sprite as a Surface converted for the display.
+        Returns None on a miss or a damaged entry.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size != size[0] * size[1] * 4:
+                    self.misses += 1
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    # convert_alpha copies the pixels, so the mapping can be closed afterwards
+                    surface = pygame.image.frombuffer(buffer, size, "RGBA").convert_alpha()
+        except (OSError, ValueError, pygame.error):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return surface
+    
+    def store(self, key, surface):
+        """Write a scaled sprite to the cache. Failures are not fatal."""
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(tmp_path, path)  # Atomic, so readers never see a partial file
+        except OSError as e:
+            print(f"Error writing sprite cache {path}: {e}")
@@ -0,0 +1,140 @@
+"""
+Startup profiler for Breakout.
+Times each stage of launching the game (imports, SDL init, display
+setup, every asset, fonts, background) and reports the breakdown as a
+table or as JSON for bench_startup.py.
+
+Usage:
+    python startup_profile.py              # print a table
+    python startup_profile.py --json -     # JSON report on stdout
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+REPORT_VERSION = 1
+
+
+class StartupProfiler:
+    """Records named, possibly nested, timed sections.
+    
+    Sections may be recorded from any thread (the background asset
+    loader reports its own), so each entry keeps the thread name.
+    Times are milliseconds since the profiler was created.
+    """
+    
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.sections = []  # (name, start_ms, duration_ms, thread)
+        self.counters = {}
+    
+    @contextmanager
+    def section(self, name):
+        """Time the body of a with block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            # list.append is atomic, so worker threads need no lock
+            self.sections.append((
+                name,
+                (start - self.origin) * 1000,
+                (end - start) * 1000,
+                threading.current_thread().name,
+            ))
+    
+    def count(self, name, value):
+        """Record a counter, such as sprite cache hits."""
+        self.counters[name] = value
+    
+    def elapsed(self):
+        """Milliseconds since the profiler was created."""
+        return (time.perf_counter() - self.origin) * 1000
+    
+    def report(self):
+        """Build a JSON-serializable report."""
+        return {
+            "version": REPORT_VERSION,
+            "total_ms": self.elapsed(),
+            "sections": [
+                {"name": name, "start_ms": start, "duration_ms": duration, "thread": thread}
+                for name, start, duration, thread in sorted(self.sections, key=lambda s: s[1])
+            ],
+            "counters": dict(self.counters),
+        }
+    
+    def format_table(self):
+        """Render the report as a human-readable table."""
+        report = self.report()
+        lines = [f"{'section':<40} {'start':>9} {'time':>9}  thread"]
+        for entry in report["sections"]:
+            lines.append(
+                f"{entry['name']:<40} {entry['start_ms']:>7.2f}ms {entry['duration_ms']:>7.2f}ms  {entry['thread']}"
+            )
+        for name, value in report["counters"].items():
+            lines.append(f"{name:<40} {value:>9}")
+        lines.append(f"{'total':<40} {report['total_ms']:>17.2f}ms")
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off: every section is a no-op."""
+    
+    _context = nullcontext()
+    
+    def section(self, name):
+        return self._context
+    
+    def count(self, name, value):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def profile_startup(headless=False):
+    """Construct a Game under the profiler and wait for its assets. Returns the profiler."""
+    profiler = StartupProfiler()
+    
+    with profiler.section("import pygame"):
+        import pygame
+    with profiler.section("import game modules"):
+        from main import Game
+    
+    with profiler.section("Game()"):
+        game = Game(headless=headless, profiler=profiler)
+    with profiler.section("wait for assets"):
+        game.assets.wait_until_ready()
+    
+    pygame.quit()
+    return profiler
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Profile Breakout startup.")
+    parser.add_argument("--headless", action="store_true",
+                        help="start like headless.py (no window, no audio)")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write the JSON report to PATH ('-' for stdout)")
+    args = parser.parse_args()
+    
+    profiler = profile_startup(headless=args.headless)
+    
+    if args.json is None:
+        print(profiler.format_table())
+    elif args.json == "-":
+        json.dump(profiler.report(), sys.stdout)
+        print()
+    else:
+        with open(args.json, "w") as f:
+            json.dump(profiler.report(), f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Frame-time telemetry for Breakout.
+Aggregates frame times into fixed windows and appends one JSON line
+per window (FPS, a frame-time histogram, live sprite counts, process
+memory) to a size-capped, rotating log. Lines are written by a
+background thread, so the game loop never waits on the disk.
+"""
+
+import bisect
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from config import (
+    TELEMETRY_WINDOW_S, TELEMETRY_BUCKETS_MS, TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS,
+    TELEMETRY_QUEUE_SIZE
+)
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def read_rss_kb():
+    """Get the resident set size of this process in kB, or None if unknown."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss // 1024
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        # Peak rather than current RSS; kB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+    return None
+
+
+class RotatingLog:
+    """Append-only text log that rotates to path.1 ... path.N at max_bytes."""
+    
+    def __init__(self, path, max_bytes=TELEMETRY_MAX_BYTES, backups=TELEMETRY_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.file = open(path, "a")
+        self.size = self.file.tell()
+    
+    def write(self, line):
+        if self.size and self.size + len(line) > self.max_bytes:
+            self._rotate()
+        self.file.write(line)
+        self.file.flush()
+        self.size += len(line)
+    
+    def _rotate(self):
+        self.file.close()
+        try:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            if self.backups:
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                os.remove(self.path)
+        finally:
+            # Reopen even if a rename failed: append to whatever is still at path
+            self.file = open(self.path, "a")
+            self.size = self.file.tell()
+    
+    def close(self):
+        self.file.close()
+
+
+class Telemetry:
+    """Frame-time aggregator with a background JSON-lines writer.
+    
+    record_frame() only bumps counters; once per window it snapshots the
+    window and hands it to the writer thread through a bounded queue.
+    If the disk falls so far behind that the queue is full, windows are
+    dropped and counted rather than blocking the game.
+    """
+    
+    def __init__(self, path, window_s=TELEMETRY_WINDOW_S, buckets_ms=TELEMETRY_BUCKETS_MS,
+                 max_bytes=TELEMETRY_MAX_BYTES, backups=TELEMETRY_BACKUPS):
+        self.window_s = window_s
+        self.buckets_ms = buckets_ms  # Upper bounds; one more bucket holds longer frames
+        self.dropped = 0
+        self._reset_window(time.monotonic())
+        
+        self.log = RotatingLog(path, max_bytes, backups)
+        self._queue = queue.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._writer.start()
+    
+    def _reset_window(self, now):
+        self.window_start = now
+        self.frames = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(self.buckets_ms) + 1)
+    
+    def record_frame(self, game, frame_ms):
+        """Count one frame of frame_ms milliseconds, emitting the window when it is over."""
+        self.frames += 1
+        self.total_ms += frame_ms
+        if frame_ms > self.max_ms:
+            self.max_ms = frame_ms
+        self.histogram[bisect.bisect_left(self.buckets_ms, frame_ms)] += 1
+        
+        now = time.monotonic()
+        if now - self.window_start >= self.window_s:
+            self._emit(game, now)
+    
+    def _emit(self, game, now):
+        record = {
+            "time": time.time(),
+            "window_s": round(now - self.window_start, 3),
+            "state": game.state,
+            "frames": self.frames,
+            "fps": round(game.clock.get_fps(), 2),
+            "frame_ms": {
+                "mean": round(self.total_ms / self.frames, 3) if self.frames else None,
+                "max": round(self.max_ms, 3),
+                "buckets": list(self.buckets_ms),
+                "histogram": self.histogram,
+            },
+            "sprites": game.sprite_counts(),
+            "dropped": self.dropped,
+        }
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        self._reset_window(now)
+    
+    def _run(self):
+        """Writer thread: serialize queued windows until stopped."""
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            record["rss_kb"] = read_rss_kb()
+            try:
+                self.log.write(json.dumps(record) + "\n")
+            except (OSError, ValueError) as e:  # ValueError: write to a closed file
+                print(f"Error writing telemetry: {e}")
+        self.log.close()
+    
+    def close(self, timeout=2.0):
+        """Stop the writer after it drains the queue (the partial window is discarded)."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._writer.join(timeout)
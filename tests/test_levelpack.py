@@ -0,0 +1,156 @@
+"""Tests for the level pack format (levelpack.py) and fitting packed levels on screen."""
+
+import struct
+import pytest
+from bricks import BrickField, field_layout
+from config import SCREEN_WIDTH, BRICK_AREA_BOTTOM, BRICK_WIDTH, BRICK_HEIGHT
+from levelpack import (
+    HEADER, INDEX_ENTRY, MAGIC, PACK_FORMAT_VERSION, LevelPack, LevelPackError,
+    encode_pattern, write_pack
+)
+from levels import LEVEL_PATTERNS, LevelManager
+
+
+class StubAssets:
+    """Records the brick sprites requested instead of loading images."""
+    
+    def get_brick_sprite(self, brick_type, is_cracked=False, size=None):
+        return (brick_type, is_cracked, size)
+
+
+def write_raw(path, levels, count=None):
+    """Write a pack without write_pack's checks: levels are (cols, rows, cells)."""
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, PACK_FORMAT_VERSION, 0, len(levels) if count is None else count))
+        offset = HEADER.size + INDEX_ENTRY.size * len(levels)
+        for cols, rows, cells in levels:
+            f.write(INDEX_ENTRY.pack(offset, cols, rows))
+            offset += len(cells)
+        for _, _, cells in levels:
+            f.write(cells)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "levels.bklp"
+    write_pack(path, LEVEL_PATTERNS)
+    with LevelPack(path) as pack:
+        assert len(pack) == len(LEVEL_PATTERNS)
+        for i, pattern in enumerate(LEVEL_PATTERNS):
+            assert pack.get_level(i) == encode_pattern(pattern)
+
+
+def test_encode_pads_short_rows():
+    cols, rows, cells = encode_pattern([[1, 2, 3], [4]])
+    assert (cols, rows) == (3, 2)
+    assert struct.unpack("6b", cells) == (1, 2, 3, 4, -1, -1)
+
+
+def test_decoded_field_matches_pattern(tmp_path):
+    path = tmp_path / "levels.bklp"
+    write_pack(path, LEVEL_PATTERNS)
+    with LevelPack(path) as pack:
+        for i, pattern in enumerate(LEVEL_PATTERNS):
+            packed = BrickField.from_cells(*pack.get_level(i), StubAssets())
+            built = BrickField.from_pattern(pattern, StubAssets())
+            assert packed.types == built.types
+            assert packed.health == built.health
+            assert packed.alive == built.alive
+            assert packed.remaining == built.remaining
+
+
+def test_not_a_pack(tmp_path):
+    path = tmp_path / "bad.bklp"
+    path.write_bytes(b"NOPE" + bytes(8))
+    with pytest.raises(LevelPackError, match="not a level pack"):
+        LevelPack(path)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.bklp"
+    path.write_bytes(b"")
+    with pytest.raises(LevelPackError):
+        LevelPack(path)
+
+
+def test_unsupported_version(tmp_path):
+    path = tmp_path / "future.bklp"
+    path.write_bytes(HEADER.pack(MAGIC, PACK_FORMAT_VERSION + 1, 0, 0))
+    with pytest.raises(LevelPackError, match="unsupported version"):
+        LevelPack(path)
+
+
+def test_truncated_level(tmp_path):
+    path = tmp_path / "short.bklp"
+    write_pack(path, LEVEL_PATTERNS[:1])
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(LevelPackError, match="truncated"):
+        LevelPack(path)
+
+
+def test_truncated_index(tmp_path):
+    path = tmp_path / "short.bklp"
+    write_raw(path, [], count=3)
+    with pytest.raises(LevelPackError):
+        LevelPack(path)
+
+
+def test_invalid_brick_type(tmp_path):
+    path = tmp_path / "bad.bklp"
+    write_raw(path, [(2, 1, bytes([0, 12]))])
+    with LevelPack(path) as pack:
+        with pytest.raises(LevelPackError, match="invalid brick types"):
+            pack.get_level(0)
+        assert 0 in pack.bad_levels
+
+
+def test_write_rejects_invalid_brick_type(tmp_path):
+    with pytest.raises(LevelPackError, match="invalid brick types"):
+        write_pack(tmp_path / "bad.bklp", [[[0, 10]]])
+
+
+def test_level_too_large(tmp_path):
+    path = tmp_path / "huge.bklp"
+    write_raw(path, [(1000, 1, bytes(1000)), (2, 1, bytes(2))])
+    with LevelPack(path) as pack:
+        assert len(pack) == 2
+        assert list(pack.bad_levels) == [0]
+        with pytest.raises(LevelPackError, match="too large"):
+            pack.get_level(0)
+        assert pack.get_level(1) == (2, 1, bytes(2))
+
+
+def test_standard_levels_keep_standard_layout():
+    for pattern in LEVEL_PATTERNS:
+        field = BrickField.from_pattern(pattern, StubAssets())
+        fitted = BrickField.from_pattern(pattern, StubAssets(), **field_layout(field.cols, field.rows))
+        assert fitted.cell_rect(len(fitted.types) - 1) == field.cell_rect(len(field.types) - 1)
+        assert fitted.get_image(0)[2] is None
+
+
+def test_large_level_fits_on_screen(tmp_path):
+    path = tmp_path / "community.bklp"
+    write_pack(path, [(100, 100, bytes(100 * 100))])
+    manager = LevelManager(StubAssets(), pack_path=path)
+    field = manager.get_level_field(0)
+    
+    first, last = field.cell_rect(0), field.cell_rect(100 * 100 - 1)
+    assert first.left >= 0 and last.right <= SCREEN_WIDTH
+    assert last.bottom <= BRICK_AREA_BOTTOM
+    assert field.remaining == 100 * 100
+    assert field.get_image(0)[2] == (field.brick_w, field.brick_h) != (BRICK_WIDTH, BRICK_HEIGHT)
+
+
+def test_manager_skips_bad_levels(tmp_path, capsys):
+    path = tmp_path / "bad.bklp"
+    write_raw(path, [(1, 1, bytes([12])), (1000, 1, bytes(1000)), (2, 1, bytes(2)), (1, 1, bytes([12]))])
+    manager = LevelManager(StubAssets(), pack_path=path)
+    field = manager.get_level_field(0)
+    assert manager.current_level == 2
+    assert field.remaining == 2
+    out = capsys.readouterr().out
+    assert "Skipping level 1" in out and "invalid brick types" in out
+    assert "Skipping level 2" in out and "too large" in out
+    
+    # The last level is bad too, so there is nothing left to play
+    assert not manager.next_level()
+    assert "Skipping level 4" in capsys.readouterr().out
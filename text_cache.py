@@ -0,0 +1,92 @@
+"""
+Text rendering cache for Breakout.
+HUD and menu strings rarely change, so rendered surfaces are kept in
+an LRU cache instead of rasterizing every frame.
+"""
+
+from collections import OrderedDict
+import pygame
+from config import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color).
+    
+    Numbers (the score counter) have a fast path: digits are rasterized
+    once per font and color into a small glyph atlas and composed into
+    new values without going through the font rasterizer.
+    """
+    
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()  # (font, text, color, antialias) -> Surface
+        self.digit_atlas = {}         # (font, color) -> list of 10 digit surfaces
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font, text, color, antialias=True):
+        """Get a rendered text surface, rasterizing it on a cache miss."""
+        key = (font, text, color, antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._store(key, surface)
+        return surface
+    
+    def render_number(self, font, value, color, prefix=""):
+        """
+        Get a surface showing prefix followed by an integer value.
+        New values are assembled from cached digit glyphs.
+        """
+        text = f"{prefix}{value}"
+        key = (font, text, color, True)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        digits = self._get_digits(font, color)
+        width, height = font.size(text)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        if prefix:
+            surface.blit(self.render(font, prefix, color), (0, 0))
+        
+        # Right-align each glyph with the end of the text up to and including it,
+        # which matches where the font places it in the full string
+        for i, char in enumerate(text[len(prefix):], len(prefix) + 1):
+            if char == "-":
+                glyph = self.render(font, "-", color)
+            else:
+                glyph = digits[ord(char) - 48]
+            surface.blit(glyph, (font.size(text[:i])[0] - glyph.get_width(), 0))
+        
+        self._store(key, surface)
+        return surface
+    
+    def _get_digits(self, font, color):
+        """Get (building if needed) the digit glyphs for a font and color."""
+        key = (font, color)
+        digits = self.digit_atlas.get(key)
+        if digits is None:
+            digits = [font.render(str(d), True, color) for d in range(10)]
+            self.digit_atlas[key] = digits
+        return digits
+    
+    def _store(self, key, surface):
+        """Insert a surface, evicting the least recently used entries."""
+        self.entries[key] = surface
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached surfaces."""
+        self.entries.clear()
+        self.digit_atlas.clear()